@@ -2,61 +2,64 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import IO, Any, Dict, Iterator, List
 
 from .errors import CacheError
 from .model import SiftConfig
-from .utils import utc_now_iso
+from .utils import json_dumps_line, json_loads, json_loads_record, utc_now_iso
 
-CACHE_VERSION = 2
-DEFAULT_SCAN_CACHE_NAME = "scan.json"
+# v3: JSON Lines — one header object, then one line per item.
+CACHE_VERSION = 3
+DEFAULT_SCAN_CACHE_NAME = "scan.jsonl"
 
 
 def cache_path(cfg: SiftConfig) -> Path:
     return cfg.paths.metadata_cache / DEFAULT_SCAN_CACHE_NAME
 
 
-def write_cache(cfg: SiftConfig, *, items: List[Dict[str, Any]], errors: int) -> Path:
+def write_cache(
+    cfg: SiftConfig, *, items: List[Dict[str, Any]], errors: int
+) -> Dict[str, Any]:
+    """Write the cache and return the payload it holds (header + items).
+
+    The returned dict is what read_cache would produce for the file just
+    written, without reading and decoding it again.
+    """
     cp = cache_path(cfg)
-    payload = {
+    header = {
         "schema_version": CACHE_VERSION,
         "generated_at_utc": utc_now_iso(),
         "incoming_root": str(cfg.paths.incoming),
         "count": len(items),
         "errors": int(errors),
-        "items": items,
     }
     tmp = cp.with_suffix(cp.suffix + ".tmp")
     # Ensure parent dir exists
     tmp.parent.mkdir(parents=True, exist_ok=True)
-    tmp.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    # Encode item by item so we never hold the whole document as one string.
+    with tmp.open("wb") as f:
+        f.write(json_dumps_line(header))
+        for item in items:
+            f.write(json_dumps_line(item))
     tmp.replace(cp)
-    return cp
-
+    return {**header, "items": items}
 
-def read_cache(cfg: SiftConfig) -> Dict[str, Any]:
-    cp = cache_path(cfg)
-    try:
-        raw = cp.read_text(encoding="utf-8")
-    except FileNotFoundError as e:
-        raise FileNotFoundError(str(cp)) from e
 
+def _read_header(cfg: SiftConfig, cp: Path, f: IO[bytes]) -> Dict[str, Any]:
     try:
-        data = json.loads(raw)
+        header = json_loads(f.readline())
     except json.JSONDecodeError as e:
         raise CacheError(f"Cache file is not valid JSON: {cp}: {e}") from e
 
-    if not isinstance(data, dict):
-        raise CacheError(f"Cache file must be a JSON object: {cp}")
+    if not isinstance(header, dict):
+        raise CacheError(f"Cache header must be a JSON object: {cp}")
 
-    if int(data.get("schema_version", -1)) != CACHE_VERSION:
+    if int(header.get("schema_version", -1)) != CACHE_VERSION:
         raise CacheError(
-            f"Cache schema mismatch in {cp}: found {data.get('schema_version')}, expected {CACHE_VERSION}"
+            f"Cache schema mismatch in {cp}: found {header.get('schema_version')}, expected {CACHE_VERSION}"
         )
 
-    inc = data.get("incoming_root")
+    inc = header.get("incoming_root")
     if inc and str(inc) != str(cfg.paths.incoming):
         raise CacheError(
             "Cache was generated for a different incoming_root. Use --rescan to rebuild.\n"
@@ -64,4 +67,65 @@ def read_cache(cfg: SiftConfig) -> Dict[str, Any]:
             f"  config incoming_root: {cfg.paths.incoming}"
         )
 
+    return header
+
+
+def _iter_lines(cp: Path, f: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    for lineno, line in enumerate(f, start=2):
+        if not line.strip():
+            continue
+        try:
+            item = json_loads_record(line)
+        except json.JSONDecodeError as e:
+            raise CacheError(f"Cache file is not valid JSON: {cp}:{lineno}: {e}") from e
+        if not isinstance(item, dict):
+            raise CacheError(f"Cache item must be a JSON object: {cp}:{lineno}")
+        yield item
+
+
+def _open(cp: Path) -> IO[bytes]:
+    try:
+        return cp.open("rb")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(str(cp)) from e
+
+
+def read_cache_header(cfg: SiftConfig) -> Dict[str, Any]:
+    """Validate the cache header and return it, without reading any items."""
+    cp = cache_path(cfg)
+    with _open(cp) as f:
+        return _read_header(cfg, cp, f)
+
+
+def iter_cache_items(cfg: SiftConfig) -> Iterator[Dict[str, Any]]:
+    """Yield cached items one at a time without materializing the list.
+
+    Raises CacheError after the last item if the file holds fewer items
+    than its header promises (same check as read_cache).
+    """
+    cp = cache_path(cfg)
+    with _open(cp) as f:
+        header = _read_header(cfg, cp, f)
+        n = 0
+        for item in _iter_lines(cp, f):
+            n += 1
+            yield item
+    if int(header.get("count", n)) != n:
+        raise CacheError(
+            f"Cache file is truncated: {cp}: expected {header.get('count')} items, found {n}"
+        )
+
+
+def read_cache(cfg: SiftConfig) -> Dict[str, Any]:
+    cp = cache_path(cfg)
+    with _open(cp) as f:
+        data = _read_header(cfg, cp, f)
+        items = list(_iter_lines(cp, f))
+
+    if int(data.get("count", len(items))) != len(items):
+        raise CacheError(
+            f"Cache file is truncated: {cp}: expected {data.get('count')} items, found {len(items)}"
+        )
+
+    data["items"] = items
     return data
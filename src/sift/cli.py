@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import argparse
-import json
 import sys
-from typing import List, Optional
-from importlib.metadata import PackageNotFoundError, version as _pkg_version
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, List, Optional
 
-from .config import load_toml, parse_config
+from .config_cache import load_or_parse
 from .errors import CacheError, ConfigError
-from .inventory import build_inventory
 from .scaffold import ensure_dirs, planned_folders
-from .transfer import transfer_inventory
-from .utils import as_path
+from .utils import as_path, json_dumps
+
+if TYPE_CHECKING:
+    import argparse
+
+# The scan/transfer modules, argparse and importlib.metadata (for --version)
+# are imported where they are used, so --print-config/--print-folders start
+# fast.
 
 
 def get_version() -> str:
@@ -21,6 +25,8 @@ def get_version() -> str:
     When running directly from source without an installed dist, return
     a clear placeholder so users understand the context.
     """
+    from importlib.metadata import PackageNotFoundError, version as _pkg_version
+
     try:
         return _pkg_version("sift")
     except PackageNotFoundError:
@@ -28,14 +34,40 @@ def get_version() -> str:
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
+    import argparse
+
+    class _VersionAction(argparse.Action):
+        """Like action="version", but only looks the version up when asked."""
+
+        def __init__(self, option_strings, dest=argparse.SUPPRESS, help=None):
+            super().__init__(
+                option_strings,
+                dest=dest,
+                default=argparse.SUPPRESS,
+                nargs=0,
+                help=help,
+            )
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            print(f"sift {get_version()}")
+            parser.exit()
+
+    def _positive_int(s: str) -> int:
+        try:
+            n = int(s)
+        except ValueError:
+            n = 0
+        if n < 1:
+            raise argparse.ArgumentTypeError(f"must be a positive integer: {s!r}")
+        return n
+
     p = argparse.ArgumentParser(
         prog="sift",
         description="Media intake: ffprobe incoming media, cache metrics, and optionally copy/move into outgoing_root.",
     )
     p.add_argument(
         "--version",
-        action="version",
-        version=f"sift {get_version()}",
+        action=_VersionAction,
         help="Print version and exit.",
     )
     p.add_argument(
@@ -56,11 +88,22 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--rescan",
         action="store_true",
-        help="Force a fresh scan + ffprobe and overwrite the cache.",
+        help="Force a fresh scan and overwrite the cache (unchanged files reuse cached ffprobe results).",
+    )
+    p.add_argument(
+        "--force-ffprobe",
+        action="store_true",
+        help="With --rescan, re-run ffprobe on every file instead of reusing cached results.",
     )
     p.add_argument(
         "--limit", type=int, default=None, help="Cap how many files are probed (debug)."
     )
+    p.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="How many ffprobe processes to run at once (overrides ffprobe.jobs).",
+    )
     p.add_argument(
         "--only-ext",
         action="append",
@@ -104,13 +147,44 @@ def print_config_summary(cfg) -> None:
     print(f"ffprobe       : {cfg.ffprobe.bin} {' '.join(cfg.ffprobe.args)} <file>")
 
 
+def _parse_print_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Recognize `[--config PATH] --print-config|--print-folders` by hand.
+
+    Those invocations only need the config, so they skip building the
+    argparse parser. Anything else (other flags, abbreviations, --help)
+    returns None and goes through argparse as usual.
+    """
+    args = SimpleNamespace(
+        config="config.toml", print_config=False, print_folders=False
+    )
+    it = iter(argv)
+    for tok in it:
+        if tok == "--print-config":
+            args.print_config = True
+        elif tok == "--print-folders":
+            args.print_folders = True
+        elif tok == "--config":
+            value = next(it, None)
+            if value is None or value.startswith("-"):
+                return None
+            args.config = value
+        elif tok.startswith("--config="):
+            args.config = tok[len("--config=") :]
+        else:
+            return None
+    if not (args.print_config or args.print_folders):
+        return None
+    return args
+
+
 def main(argv: Optional[List[str]] = None) -> int:
-    args = build_arg_parser().parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_print_args(argv) or build_arg_parser().parse_args(argv)
 
     cfg_path = as_path(str(args.config))
     try:
-        root = load_toml(cfg_path)
-        cfg = parse_config(root)
+        cfg = load_or_parse(cfg_path)
     except ConfigError as e:
         print(f"[sift] config error: {e}", file=sys.stderr)
         return 2
@@ -124,6 +198,12 @@ def main(argv: Optional[List[str]] = None) -> int:
             print(p)
         return 0
 
+    from .cache import cache_path
+    from .inventory import build_inventory
+
+    if args.jobs is not None:
+        cfg = replace(cfg, ffprobe=replace(cfg.ffprobe, jobs=args.jobs))
+
     if cfg.io.mkdirs:
         ensure_dirs(cfg)
 
@@ -133,6 +213,10 @@ def main(argv: Optional[List[str]] = None) -> int:
             rescan=bool(args.rescan),
             only_ext=list(args.only_ext) if args.only_ext else None,
             limit=args.limit,
+            force_ffprobe=bool(args.force_ffprobe),
+            # --apply changes the filesystem, so validate the whole cache
+            # before the first copy/move instead of streaming it.
+            lazy_items=not args.apply,
         )
     except (ConfigError, CacheError, OSError) as e:
         print(f"[sift] inventory error: {e}", file=sys.stderr)
@@ -140,12 +224,12 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     count = int(inv.get("count", 0))
     errors = int(inv.get("errors", 0))
-    print(
-        f"[sift] inventory: {count} files (errors={errors}) -> {cfg.paths.metadata_cache / 'scan.json'}"
-    )
+    print(f"[sift] inventory: {count} files (errors={errors}) -> {cache_path(cfg)}")
 
     # NEW: apply transfer step
     if args.apply or args.dry_run:
+        from .transfer import transfer_inventory
+
         if cfg.io.mode not in {"copy", "move"}:
             print(f"[sift] invalid io.mode: {cfg.io.mode}", file=sys.stderr)
             return 4
@@ -155,12 +239,18 @@ def main(argv: Optional[List[str]] = None) -> int:
         if effective_dry_run:
             print("[sift] transfer: DRY RUN (no filesystem changes)")
 
-        result = transfer_inventory(
-            cfg,
-            inv,
-            dry_run=effective_dry_run,
-            only_ok_ffprobe=bool(args.only_ok_ffprobe),
-        )
+        try:
+            result = transfer_inventory(
+                cfg,
+                inv,
+                dry_run=effective_dry_run,
+                only_ok_ffprobe=bool(args.only_ok_ffprobe),
+            )
+        except CacheError as e:
+            # Without --apply, items stream from the cache file, so a bad
+            # line surfaces here.
+            print(f"[sift] inventory error: {e}", file=sys.stderr)
+            return 3
 
         # Summary first (INTJ-friendly)
         print(
@@ -181,9 +271,7 @@ def main(argv: Optional[List[str]] = None) -> int:
                 "failed": result.failed,
                 "details": result.details,
             }
-            rp.write_text(
-                json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-            )
+            rp.write_bytes(json_dumps(payload))
             print(f"[sift] wrote transfer report: {rp}")
 
         # Non-zero if any failures
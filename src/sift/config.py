@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import copy
+import importlib.util
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .errors import ConfigError
 from .model import (
+    CacheConfig,
+    DEFAULT_TV_SEASON_EPISODE_REGEX,
+    DEFAULT_TV_SXE_REGEX,
     ClassificationConfig,
     FFProbeConfig,
     FlagsConfig,
@@ -24,22 +31,58 @@ try:
 except ModuleNotFoundError as exc:  # pragma: no cover
     raise SystemExit("Python 3.11+ required (missing tomllib).") from exc
 
+try:
+    import rtoml  # optional: native TOML parser, used when installed
+except ModuleNotFoundError:  # pragma: no cover - depends on environment
+    rtoml = None
+
+_TOML_ERRORS: Tuple[type[Exception], ...] = (tomllib.TOMLDecodeError,)
+if rtoml is not None:  # pragma: no cover - depends on environment
+    _TOML_ERRORS += (rtoml.TomlParsingError,)
+
+
+# Allowed values for enumerated settings.
+_VALID_IO_MODES = frozenset(("move", "copy"))
+_VALID_EXECUTORS = frozenset(("thread", "process"))
+_VALID_MEDIA_STRATS = frozenset(("folder", "guess", "sxe"))
+_VALID_TIER_COUNTS = frozenset((3, 5))
+_VALID_FINGERPRINTS = frozenset(("off", "blake2b", "blake3"))
+
+
+# Parsed documents keyed by path, valid while (mtime_ns, size) is unchanged.
+_TOML_MEMO: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 def load_toml(path: Path) -> Dict[str, Any]:
+    """Parse a TOML file, reusing the previous parse if the file is unchanged.
+
+    Each caller gets its own copy, so mutating the result (or a config built
+    from it) can't leak into later loads.
+    """
     try:
-        raw = path.read_bytes()
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        hit = _TOML_MEMO.get(path)
+        if hit is not None and hit[0] == key:
+            return copy.deepcopy(hit[1])
+        if rtoml is not None:
+            data = rtoml.loads(path.read_bytes().decode("utf-8"))
+        else:
+            with path.open("rb") as fp:
+                data = tomllib.load(fp)
     except FileNotFoundError as e:
         raise ConfigError(
             f"Config file not found: {path}\n"
             "Create it by copying config.example.toml to config.toml and editing paths."
         ) from e
-    try:
-        return tomllib.loads(raw.decode("utf-8"))
     except UnicodeDecodeError as e:
         raise ConfigError(f"Config is not valid UTF-8: {path}") from e
-    except tomllib.TOMLDecodeError as e:
+    except _TOML_ERRORS as e:
         raise ConfigError(f"TOML parse error in {path}: {e}") from e
 
+    _TOML_MEMO[path] = (key, data)
+    return copy.deepcopy(data)
+
 
 def _require_table(root: Dict[str, Any], table: str) -> Dict[str, Any]:
     if table not in root or not isinstance(root[table], dict):
@@ -56,91 +99,59 @@ def _get(root: Dict[str, Any], path: str) -> Any:
     return cur
 
 
+_MISSING: Any = object()
+
+
 def expect(
     root: Dict[str, Any],
     path: str,
     typ: type,
     *,
-    default=object(),
+    default: Any = _MISSING,
     required: bool = True,
+    nonempty: bool = False,
+    items: type | None = None,
 ) -> Any:
     """Traverse `path` (dot-separated) and ensure the value exists and is `typ`.
 
     If `default` is provided and the value is missing, `default` is returned.
+    `float` also accepts integers (returned as float), `nonempty` rejects empty
+    strings/containers and `items` checks the element type of a list.
     Raises `ConfigError` on missing required values or type mismatches.
     """
     v = _get(root, path)
     if v is None:
-        if default is not object():
+        if default is not _MISSING:
             return default
         if required:
             raise ConfigError(f"Missing required config value: {path}")
         return None
+    if typ is float and isinstance(v, int):
+        v = float(v)
     if not isinstance(v, typ):
         raise ConfigError(
             f"Expected {typ.__name__} for '{path}', got: {type(v).__name__}"
         )
+    if nonempty and not v:
+        raise ConfigError(f"Expected non-empty {typ.__name__} for '{path}'")
+    if items is not None and not all(isinstance(x, items) for x in v):
+        raise ConfigError(f"Expected list of {items.__name__} for '{path}', got: {v!r}")
     return v
 
 
-def _as_bool(d: Dict[str, Any], key: str) -> bool:
-    v = d.get(key)
-    if isinstance(v, bool):
-        return v
-    raise ConfigError(f"Expected boolean for '{key}', got: {type(v).__name__}")
-
-
-def _as_str(d: Dict[str, Any], key: str) -> str:
-    v = d.get(key)
-    if isinstance(v, str) and v != "":
-        return v
-    raise ConfigError(f"Expected non-empty string for '{key}', got: {v!r}")
-
+def _ensure_dict_of(d: Dict[str, Any], vtype: type, path: str) -> Dict[str, Any]:
+    """A copy of `d` with every value converted to `vtype`.
 
-def _as_int(d: Dict[str, Any], key: str) -> int:
-    v = d.get(key)
-    if isinstance(v, int):
-        return v
-    raise ConfigError(f"Expected integer for '{key}', got: {type(v).__name__}")
-
-
-def _as_float(d: Dict[str, Any], key: str) -> float:
-    v = d.get(key)
-    if isinstance(v, (int, float)):
-        return float(v)
-    raise ConfigError(f"Expected float for '{key}', got: {type(v).__name__}")
-
-
-def _as_list_str(d: Dict[str, Any], key: str) -> List[str]:
-    v = d.get(key)
-    if isinstance(v, list) and all(isinstance(x, str) for x in v):
-        return v
-    raise ConfigError(f"Expected list of strings for '{key}', got: {v!r}")
-
-
-def _as_dict(d: Dict[str, Any], key: str) -> Dict[str, Any]:
-    v = d.get(key)
-    if isinstance(v, dict):
-        return v
-    raise ConfigError(f"Expected table/dict for '{key}', got: {type(v).__name__}")
-
-
-def _optional_str(d: Dict[str, Any], key: str, default: str) -> str:
-    if key not in d:
-        return default
-    v = d.get(key)
-    if isinstance(v, str):
-        return v
-    raise ConfigError(f"Expected string for '{key}', got: {type(v).__name__}")
-
-
-def _optional_bool(d: Dict[str, Any], key: str, default: bool) -> bool:
-    if key not in d:
-        return default
-    v = d.get(key)
-    if isinstance(v, bool):
-        return v
-    raise ConfigError(f"Expected boolean for '{key}', got: {type(v).__name__}")
+    Always a new dict, so the config never shares a table with its caller.
+    TOML tables almost always hold the right types already; then the copy
+    is a plain dict() instead of a per-value conversion.
+    """
+    if all(type(v) is vtype for v in d.values()):
+        return dict(d)
+    try:
+        return {k: vtype(v) for k, v in d.items()}
+    except (TypeError, ValueError) as e:
+        raise ConfigError(f"'{path}' values must be {vtype.__name__}: {e}") from e
 
 
 def parse_config(root: Dict[str, Any]) -> SiftConfig:
@@ -153,32 +164,48 @@ def parse_config(root: Dict[str, Any]) -> SiftConfig:
 
     # ---- io
     mode = expect(root, "io.mode", str).lower()
-    if mode not in {"move", "copy"}:
+    if mode not in _VALID_IO_MODES:
         raise ConfigError("io.mode must be 'move' or 'copy'")
+    scan_parallelism = expect(root, "io.scan_parallelism", int, default=1)
+    if isinstance(scan_parallelism, bool) or scan_parallelism < 1:
+        raise ConfigError("io.scan_parallelism must be a positive integer")
+    transfer_parallelism = expect(root, "io.transfer_parallelism", int, default=1)
+    if isinstance(transfer_parallelism, bool) or transfer_parallelism < 1:
+        raise ConfigError("io.transfer_parallelism must be a positive integer")
     io_cfg = IOConfig(
         mode=mode,
         mkdirs=expect(root, "io.mkdirs", bool),
         dedupe_on_collision=expect(root, "io.dedupe_on_collision", bool),
+        scan_parallelism=scan_parallelism,
+        transfer_parallelism=transfer_parallelism,
+        preserve_metadata=expect(root, "io.preserve_metadata", bool, default=True),
     )
 
     # ---- ffprobe
+    jobs = expect(root, "ffprobe.jobs", int, default=None)
+    if jobs is None:
+        jobs = min(os.cpu_count() or 1, 8)
+    elif isinstance(jobs, bool) or jobs < 1:
+        raise ConfigError("ffprobe.jobs must be a positive integer")
+    executor = expect(root, "ffprobe.executor", str, default="thread").lower()
+    if executor not in _VALID_EXECUTORS:
+        raise ConfigError("ffprobe.executor must be 'thread' or 'process'")
     ffprobe_cfg = FFProbeConfig(
         bin=expect(root, "ffprobe.bin", str),
-        args=_as_list_str(expect(root, "ffprobe", dict), "args"),
+        args=expect(root, "ffprobe.args", list, items=str),
+        jobs=jobs,
+        executor=executor,
     )
 
     # ---- classification
     media_type_strategy = expect(
         root, "classification.media_type_strategy", str
     ).lower()
-    if media_type_strategy not in {"folder", "guess", "sxe"}:
+    if media_type_strategy not in _VALID_MEDIA_STRATS:
         raise ConfigError(
             "classification.media_type_strategy must be 'folder', 'guess', or 'sxe'"
         )
 
-    default_sxe = r"(?i)\bs\s*\d{1,2}\s*[._ -]?\s*e\s*\d{1,3}\b"
-    default_words = r"(?i)\bseason\s*\d{1,2}\b.*\bepisode\s*\d{1,3}\b"
-
     classification_tbl = expect(root, "classification", dict)
 
     # Parse resolution settings with defaults
@@ -199,56 +226,78 @@ def parse_config(root: Dict[str, Any]) -> SiftConfig:
         raise ConfigError(
             "classification.resolution.vertical_thresholds must be a table/dict"
         )
-    vertical_thresholds = {k: int(v) for k, v in vertical_thresholds_raw.items()}
-
-    classification_cfg = ClassificationConfig(
-        media_type_strategy=media_type_strategy,
-        tv_sxe_regex=_optional_str(classification_tbl, "tv_sxe_regex", default_sxe),
-        enable_season_episode_words=_optional_bool(
-            classification_tbl, "enable_season_episode_words", False
-        ),
-        tv_season_episode_regex=_optional_str(
-            classification_tbl,
-            "tv_season_episode_regex",
-            default_words,
-        ),
-        video_stream_strategy=expect(
-            root, "classification.video_stream_strategy", str
-        ).lower(),
-        audio_stream_strategy=expect(
-            root, "classification.audio_stream_strategy", str
-        ).lower(),
-        audio_codec_preference=_as_list_str(
-            classification_tbl, "audio_codec_preference"
-        ),
-        problem_audio_codecs=_as_list_str(classification_tbl, "problem_audio_codecs"),
-        problem_audio_profile_regex=_as_list_str(
-            classification_tbl, "problem_audio_profile_regex"
-        ),
-        hdr_color_transfer=_as_list_str(classification_tbl, "hdr_color_transfer"),
-        hdr_side_data_regex=_as_list_str(classification_tbl, "hdr_side_data_regex"),
-        horizontal_4k_threshold=horizontal_4k_threshold,
-        vertical_thresholds=vertical_thresholds,
+    vertical_thresholds = _ensure_dict_of(
+        vertical_thresholds_raw, int, "classification.resolution.vertical_thresholds"
     )
 
+    try:
+        classification_cfg = ClassificationConfig(
+            media_type_strategy=media_type_strategy,
+            tv_sxe_regex=expect(
+                root, "classification.tv_sxe_regex", str, default=DEFAULT_TV_SXE_REGEX
+            ),
+            enable_season_episode_words=expect(
+                root,
+                "classification.enable_season_episode_words",
+                bool,
+                default=False,
+            ),
+            tv_season_episode_regex=expect(
+                root,
+                "classification.tv_season_episode_regex",
+                str,
+                default=DEFAULT_TV_SEASON_EPISODE_REGEX,
+            ),
+            video_stream_strategy=expect(
+                root, "classification.video_stream_strategy", str
+            ).lower(),
+            audio_stream_strategy=expect(
+                root, "classification.audio_stream_strategy", str
+            ).lower(),
+            audio_codec_preference=expect(
+                root, "classification.audio_codec_preference", list, items=str
+            ),
+            problem_audio_codecs=expect(
+                root, "classification.problem_audio_codecs", list, items=str
+            ),
+            problem_audio_profile_regex=expect(
+                root, "classification.problem_audio_profile_regex", list, items=str
+            ),
+            hdr_color_transfer=expect(
+                root, "classification.hdr_color_transfer", list, items=str
+            ),
+            hdr_side_data_regex=expect(
+                root, "classification.hdr_side_data_regex", list, items=str
+            ),
+            horizontal_4k_threshold=horizontal_4k_threshold,
+            vertical_thresholds=vertical_thresholds,
+        )
+    except re.error as e:
+        # All classification patterns are compiled in ClassificationConfig.
+        raise ConfigError(f"classification: invalid regex {e.pattern!r}: {e}") from e
+
     # ---- naming
     naming_tbl = expect(root, "naming", dict)
     naming_cfg = NamingConfig(
-        movie_template=_as_str(naming_tbl, "movie_template"),
-        tv_template=_as_str(naming_tbl, "tv_template"),
-        hdr_sep=_as_str(naming_tbl, "hdr_sep"),
-        flags_sep=_as_str(naming_tbl, "flags_sep"),
+        movie_template=expect(root, "naming.movie_template", str, nonempty=True),
+        tv_template=expect(root, "naming.tv_template", str, nonempty=True),
+        hdr_sep=expect(root, "naming.hdr_sep", str, nonempty=True),
+        flags_sep=expect(root, "naming.flags_sep", str, nonempty=True),
         fallback_to_stem=bool(naming_tbl.get("fallback_to_stem", True)),
-        vcodec_map={k: str(v) for k, v in _as_dict(naming_tbl, "vcodec_map").items()},
-        acodec_map={k: str(v) for k, v in _as_dict(naming_tbl, "acodec_map").items()},
-        sanitize=_as_bool(naming_tbl, "sanitize"),
-        max_filename_len=_as_int(naming_tbl, "max_filename_len"),
+        vcodec_map=_ensure_dict_of(
+            expect(root, "naming.vcodec_map", dict), str, "naming.vcodec_map"
+        ),
+        acodec_map=_ensure_dict_of(
+            expect(root, "naming.acodec_map", dict), str, "naming.acodec_map"
+        ),
+        sanitize=expect(root, "naming.sanitize", bool),
+        max_filename_len=expect(root, "naming.max_filename_len", int),
     )
 
     # ---- tier model
     tier_model = expect(root, "tier_model", dict)
-    tiers = _as_int(tier_model, "tiers")
-    if tiers not in {3, 5}:
+    tiers = expect(root, "tier_model.tiers", int)
+    if tiers not in _VALID_TIER_COUNTS:
         raise ConfigError("tier_model.tiers must be 3 or 5")
 
     tier_list = tier_model.get("tier")
@@ -270,8 +319,8 @@ def parse_config(root: Dict[str, Any]) -> SiftConfig:
 
         parsed_tiers.append(
             TierDef(
-                id=_as_str(t, "id"),
-                folder=_as_str(t, "folder"),
+                id=expect(t, "id", str, nonempty=True),
+                folder=expect(t, "folder", str, nonempty=True),
                 description=str(t.get("description", "")).strip(),
                 requires=dict(requires),
                 flags=list(flags),
@@ -305,30 +354,47 @@ def parse_config(root: Dict[str, Any]) -> SiftConfig:
         raise ConfigError("flags.judgement_flags must be a list of strings")
 
     flags_cfg = FlagsConfig(
-        enable_hfr_flag=_as_bool(flags, "enable_hfr_flag"),
-        hfr_fps_threshold=_as_float(flags, "hfr_fps_threshold"),
-        enable_low_bitrate_flag=_as_bool(flags, "enable_low_bitrate_flag"),
-        low_bitrate_thresholds={k: int(v) for k, v in low_bt.items()},
-        low_bitrate_flag_name=_as_str(flags, "low_bitrate_flag_name"),
+        enable_hfr_flag=expect(root, "flags.enable_hfr_flag", bool),
+        hfr_fps_threshold=expect(root, "flags.hfr_fps_threshold", float),
+        enable_low_bitrate_flag=expect(root, "flags.enable_low_bitrate_flag", bool),
+        low_bitrate_thresholds=_ensure_dict_of(
+            low_bt, int, "flags.low_bitrate_thresholds"
+        ),
+        low_bitrate_flag_name=expect(
+            root, "flags.low_bitrate_flag_name", str, nonempty=True
+        ),
         judgement_flags=list(jf),
     )
 
     # ---- reporting
-    reporting = _require_table(root, "reporting")
+    _require_table(root, "reporting")
     reporting_cfg = ReportingConfig(
-        write_jsonl_report=_as_bool(reporting, "write_jsonl_report"),
-        report_path=as_path(_as_str(reporting, "report_path")),
+        write_jsonl_report=expect(root, "reporting.write_jsonl_report", bool),
+        report_path=as_path(expect(root, "reporting.report_path", str, nonempty=True)),
     )
 
     # ---- sample_detection
-    sample_detection = _require_table(root, "sample_detection")
+    _require_table(root, "sample_detection")
     sample_detection_cfg = SampleDetectionConfig(
-        enabled=_optional_bool(sample_detection, "enabled", True),
-        min_duration_s=_as_float(sample_detection, "min_duration_s"),
-        prefer_longest_variant=_as_bool(sample_detection, "prefer_longest_variant"),
-        min_video_streams=_as_int(sample_detection, "min_video_streams"),
+        enabled=expect(root, "sample_detection.enabled", bool, default=True),
+        min_duration_s=expect(root, "sample_detection.min_duration_s", float),
+        prefer_longest_variant=expect(
+            root, "sample_detection.prefer_longest_variant", bool
+        ),
+        min_video_streams=expect(root, "sample_detection.min_video_streams", int),
     )
 
+    # ---- cache (optional)
+    fingerprint = expect(root, "cache.fingerprint", str, default="off").lower()
+    if fingerprint not in _VALID_FINGERPRINTS:
+        raise ConfigError("cache.fingerprint must be 'off', 'blake2b' or 'blake3'")
+    if fingerprint == "blake3" and importlib.util.find_spec("blake3") is None:
+        raise ConfigError(
+            "cache.fingerprint = 'blake3' requires the blake3 package "
+            "(pip install blake3)"
+        )
+    cache_cfg = CacheConfig(fingerprint=fingerprint)
+
     return SiftConfig(
         paths=paths_cfg,
         io=io_cfg,
@@ -339,4 +405,72 @@ def parse_config(root: Dict[str, Any]) -> SiftConfig:
         flags=flags_cfg,
         reporting=reporting_cfg,
         sample_detection=sample_detection_cfg,
+        cache=cache_cfg,
+    )
+
+
+# The settings parse_config passes through as_path (which expands $VARS).
+_PATH_KEYS = (
+    "paths.incoming",
+    "paths.outgoing_root",
+    "paths.metadata_cache",
+    "reporting.report_path",
+)
+
+
+def mentions_env(root: Dict[str, Any]) -> bool:
+    """Whether any path setting references $VARIABLES.
+
+    Only those are expanded, so other values (regexes with $ anchors, say)
+    don't make a parsed config depend on the environment.
+    """
+    for key in _PATH_KEYS:
+        v = _get(root, key)
+        if isinstance(v, str) and "$" in v:
+            return True
+    return False
+
+
+# Parsed configs keyed by path; see load_config for what invalidates them.
+_CONFIG_MEMO: Dict[str, Tuple[Tuple[Any, ...], SiftConfig]] = {}
+
+
+def machine_key() -> Tuple[Any, ...]:
+    """What parse_config reads from the machine rather than the file.
+
+    The CPU count sets the default ffprobe.jobs, and cache.fingerprint =
+    "blake3" is only accepted while blake3 is installed; memoized or cached
+    configs must be re-parsed when either changes.
+    """
+    return (os.cpu_count(), importlib.util.find_spec("blake3") is not None)
+
+
+def load_config(path: Path) -> SiftConfig:
+    """load_toml + parse_config, memoized for the life of the process.
+
+    An entry is reused while the file's (mtime_ns, size), the cwd/HOME
+    that relative and ~ paths resolve against, and machine_key() are
+    unchanged. Configs whose
+    paths reference $VARIABLES are parsed every time. SiftConfig is frozen, so
+    callers can share the returned object.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return parse_config(load_toml(path))  # raises the usual ConfigError
+    key = (
+        st.st_mtime_ns,
+        st.st_size,
+        os.getcwd(),
+        os.path.expanduser("~"),
+        *machine_key(),
     )
+    hit = _CONFIG_MEMO.get(str(path))
+    if hit is not None and hit[0] == key:
+        return hit[1]
+
+    root = load_toml(path)
+    cfg = parse_config(root)
+    if not mentions_env(root):
+        _CONFIG_MEMO[str(path)] = (key, cfg)
+    return cfg
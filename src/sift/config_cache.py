@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from . import config as config_mod
+from . import model, rules, utils
+from .config import load_config, load_toml
+from .model import SiftConfig
+
+# Bump when parse_config's output changes in a way the key below can't see.
+CONFIG_CACHE_VERSION = 1
+
+
+def config_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "sift"
+
+
+def _cache_file(cfg_path: Path) -> Path:
+    digest = hashlib.blake2b(str(cfg_path).encode("utf-8"), digest_size=8)
+    return config_cache_dir() / f"config-{digest.hexdigest()}.pkl"
+
+
+def _cache_key(cfg_path: Path) -> Tuple[Any, ...]:
+    """Everything a parsed config depends on, checkable with a few stat()s.
+
+    Relative and ~ paths are resolved against cwd/HOME, and the pickle must
+    match the running parser, dataclasses and the helpers they call (rules,
+    utils.as_path), so those are part of the key, as is config.machine_key()
+    (CPU count and blake3 availability).
+    """
+    key: list[Any] = [CONFIG_CACHE_VERSION, str(cfg_path)]
+    sources = (config_mod.__file__, model.__file__, rules.__file__, utils.__file__)
+    for p in (cfg_path, *sources):
+        st = os.stat(p)
+        key += (st.st_mtime_ns, st.st_size)
+    key += (os.getcwd(), os.path.expanduser("~"))
+    key += config_mod.machine_key()
+    return tuple(key)
+
+
+def _read(cache_file: Path, key: Tuple[Any, ...]) -> Optional[SiftConfig]:
+    try:
+        with cache_file.open("rb") as f:
+            cached_key, cfg = pickle.load(f)
+    except Exception:
+        # Missing, truncated or written by an incompatible version: re-parse.
+        return None
+    if cached_key != key or not isinstance(cfg, SiftConfig):
+        return None
+    return cfg
+
+
+def _write(cache_file: Path, key: Tuple[Any, ...], cfg: SiftConfig) -> None:
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            pickle.dump((key, cfg), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache_file)
+    except OSError:
+        # The cache is an optimization; a read-only home must not break runs.
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def load_or_parse(cfg_path: Path) -> SiftConfig:
+    """load_toml + parse_config, reusing a pickled result while unchanged.
+
+    The pickle lives under $XDG_CACHE_HOME/sift (default ~/.cache/sift).
+    Configs whose paths reference environment variables ($VAR) are never cached,
+    since their parsed paths can change without the file changing, and
+    SIFT_CONFIG_CACHE=0 turns the on-disk cache off entirely (debugging).
+    Raises ConfigError exactly like the uncached path.
+    """
+    if os.environ.get("SIFT_CONFIG_CACHE") == "0":
+        return load_config(cfg_path)
+
+    try:
+        key = _cache_key(cfg_path)
+    except OSError:
+        key = None
+    cache_file = _cache_file(cfg_path)
+    if key is not None:
+        cfg = _read(cache_file, key)
+        if cfg is not None:
+            return cfg
+
+    cfg = load_config(cfg_path)
+
+    # load_toml is memoized, so this re-uses the parse load_config just did.
+    if key is not None and not config_mod.mentions_env(load_toml(cfg_path)):
+        _write(cache_file, key, cfg)
+    return cfg
@@ -1,91 +1,131 @@
 from __future__ import annotations
 
 import json
+import shutil
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 
 from .model import FFProbeConfig
-from .utils import parse_ratio, safe_float, safe_int
+from .utils import json_loads, parse_ratio, safe_float, safe_int
+
+
+@lru_cache(maxsize=None)
+def _resolve_bin(name: str) -> Optional[str]:
+    """Resolve the ffprobe executable once instead of searching PATH per spawn."""
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=None)
+def _argv_prefix(name: str, args: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+    """Resolved executable + fixed arguments, built once per (bin, args)."""
+    exe = _resolve_bin(name)
+    return None if exe is None else (exe, *args)
 
 
 def run_ffprobe(
-    cfg: FFProbeConfig, media_path: Path
+    cfg: FFProbeConfig, media_path: Union[str, Path]
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """Return (json, error_str). Never raises for per-file failures."""
-    cmd = [cfg.bin, *cfg.args, str(media_path)]
+    prefix = _argv_prefix(cfg.bin, tuple(cfg.args))
+    if prefix is None:
+        return None, f"ffprobe not found: {cfg.bin}"
+    cmd = [*prefix, str(media_path)]
     try:
-        proc = subprocess.run(cmd, check=False, capture_output=True, text=True)
+        proc = subprocess.run(
+            cmd,
+            check=False,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+        )
     except FileNotFoundError:
         return None, f"ffprobe not found: {cfg.bin}"
     except OSError as e:
         return None, f"ffprobe exec error: {e}"
 
     if proc.returncode != 0:
-        stderr = (proc.stderr or "").strip()
+        # Output stays as bytes; only decode stderr on the failure path.
+        stderr = (proc.stderr or b"").decode("utf-8", "replace").strip()
         return None, stderr or f"ffprobe exited {proc.returncode}"
 
     try:
-        return json.loads(proc.stdout), None
-    except json.JSONDecodeError as e:
+        return json_loads(proc.stdout), None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         return None, f"ffprobe output was not valid JSON: {e}"
 
 
-def summarize(ff: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract a compact subset of technical metrics (stable cache footprint)."""
-    out: Dict[str, Any] = {"ok": True}
+def _label(v: Any) -> Any:
+    """Intern low-cardinality labels (codec names, pix_fmt, ...) so the
+    thousands of items in an inventory share one str object per value."""
+    return sys.intern(v) if type(v) is str else v
 
-    fmt = ff.get("format") or {}
-    out["container"] = fmt.get("format_name")
-    out["duration_s"] = safe_float(fmt.get("duration"))
-    out["overall_bitrate_bps"] = safe_int(fmt.get("bit_rate"))
-    out["size_bytes_probe"] = safe_int(fmt.get("size"))
 
-    streams = ff.get("streams") or []
-    if not isinstance(streams, list):
-        streams = []
+def _video_key(s: Dict[str, Any]) -> tuple[int, int]:
+    """Rank video streams by pixel count, then height."""
+    w = safe_int(s.get("width")) or 0
+    h = safe_int(s.get("height")) or 0
+    return (w * h, h)
 
-    vstreams = [
-        s for s in streams if isinstance(s, dict) and s.get("codec_type") == "video"
-    ]
-    astreams = [
-        s for s in streams if isinstance(s, dict) and s.get("codec_type") == "audio"
-    ]
 
-    vbest = None
-    if vstreams:
+def _audio_key(s: Dict[str, Any]) -> tuple[int, int]:
+    """Rank audio streams by channel count, then bitrate."""
+    ch = safe_int(s.get("channels")) or 0
+    br = safe_int(s.get("bit_rate")) or 0
+    return (ch, br)
 
-        def vkey(s: Dict[str, Any]) -> tuple[int, int]:
-            w = safe_int(s.get("width")) or 0
-            h = safe_int(s.get("height")) or 0
-            return (w * h, h)
 
-        vbest = sorted(vstreams, key=vkey, reverse=True)[0]
+def summarize(ff: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract a compact subset of technical metrics (stable cache footprint).
 
-    abest = None
-    if astreams:
+    Trusts ffprobe's JSON schema (streams is a list of objects); output of
+    another shape raises AttributeError/TypeError, which the caller records
+    as a failed probe.
+    """
+    out: Dict[str, Any] = {"ok": True}
 
-        def akey(s: Dict[str, Any]) -> tuple[int, int]:
-            ch = safe_int(s.get("channels")) or 0
-            br = safe_int(s.get("bit_rate")) or 0
-            return (ch, br)
+    fmt = ff.get("format") or {}
+    out["container"] = _label(fmt.get("format_name"))
+    out["duration_s"] = safe_float(fmt.get("duration"))
+    out["overall_bitrate_bps"] = safe_int(fmt.get("bit_rate"))
+    out["size_bytes_probe"] = safe_int(fmt.get("size"))
 
-        abest = sorted(astreams, key=akey, reverse=True)[0]
+    streams = ff.get("streams") or ()
+
+    # One pass: count streams per type and keep the best of each. Strict >
+    # keeps the first stream among equals.
+    vcount = acount = 0
+    vbest: Optional[Dict[str, Any]] = None
+    abest: Optional[Dict[str, Any]] = None
+    vkey_best = akey_best = (-1, -1)
+    for s in streams:
+        codec_type = s.get("codec_type")
+        if codec_type == "video":
+            vcount += 1
+            k = _video_key(s)
+            if k > vkey_best:
+                vkey_best, vbest = k, s
+        elif codec_type == "audio":
+            acount += 1
+            k = _audio_key(s)
+            if k > akey_best:
+                akey_best, abest = k, s
 
     if vbest:
         vf: Dict[str, Any] = {
-            "codec": vbest.get("codec_name"),
-            "profile": vbest.get("profile"),
+            "codec": _label(vbest.get("codec_name")),
+            "profile": _label(vbest.get("profile")),
             "width": safe_int(vbest.get("width")),
             "height": safe_int(vbest.get("height")),
-            "pix_fmt": vbest.get("pix_fmt"),
+            "pix_fmt": _label(vbest.get("pix_fmt")),
             "bit_rate_bps": safe_int(vbest.get("bit_rate")),
             "fps": parse_ratio(vbest.get("avg_frame_rate"))
             or parse_ratio(vbest.get("r_frame_rate")),
-            "color_space": vbest.get("color_space"),
-            "color_transfer": vbest.get("color_transfer"),
-            "color_primaries": vbest.get("color_primaries"),
-            "color_range": vbest.get("color_range"),
+            "color_space": _label(vbest.get("color_space")),
+            "color_transfer": _label(vbest.get("color_transfer")),
+            "color_primaries": _label(vbest.get("color_primaries")),
+            "color_range": _label(vbest.get("color_range")),
         }
         tags = vbest.get("tags") if isinstance(vbest.get("tags"), dict) else {}
         vf["tags"] = {k: str(v) for k, v in tags.items()} if tags else {}
@@ -94,20 +134,20 @@ def summarize(ff: Dict[str, Any]) -> Dict[str, Any]:
             types = []
             for sd in side_data:
                 if isinstance(sd, dict) and sd.get("side_data_type"):
-                    types.append(str(sd.get("side_data_type")))
+                    types.append(_label(str(sd.get("side_data_type"))))
             vf["side_data_types"] = sorted(set(types))
         out["video"] = vf
 
     if abest:
         af: Dict[str, Any] = {
-            "codec": abest.get("codec_name"),
-            "profile": abest.get("profile"),
+            "codec": _label(abest.get("codec_name")),
+            "profile": _label(abest.get("profile")),
             "channels": safe_int(abest.get("channels")),
-            "channel_layout": abest.get("channel_layout"),
+            "channel_layout": _label(abest.get("channel_layout")),
             "sample_rate_hz": safe_int(abest.get("sample_rate")),
             "bit_rate_bps": safe_int(abest.get("bit_rate")),
         }
         out["audio"] = af
 
-    out["stream_counts"] = {"video": len(vstreams), "audio": len(astreams)}
+    out["stream_counts"] = {"video": vcount, "audio": acount}
     return out
@@ -1,39 +1,66 @@
 from __future__ import annotations
 
+import hashlib
+import multiprocessing
 import re
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import blake3  # optional: SIMD hashing for cache.fingerprint = "blake3"
+except ModuleNotFoundError:  # pragma: no cover - depends on environment
+    blake3 = None
 
 from . import cache as cache_mod
+from .errors import CacheError, ConfigError
 from .ffprobe import run_ffprobe, summarize
 from .model import SiftConfig
-from .scan import scan_files
+from .router import render_name
+from .scan import ScanEntry, scan_entries
+from .utils import split_name
+
+
+# _normalize_stem patterns, compiled once (it runs for every inventory item).
+_BRACKETED_RE = re.compile(r"\[.*?\]")
+# Everything else _normalize_stem strips, as one alternation: parenthesized
+# tags, punctuation runs, and sample/extra keywords and resolutions (720p,
+# 1080p, 2160p, 4k, ...). The lookarounds are \b with "_" treated as a
+# separator, as it is once the punctuation is replaced.
+_STEM_NOISE_RE = re.compile(
+    r"\(.*?\)"
+    r"|[._\-]+"
+    r"|(?<![^\W_])"
+    r"(?:sample|trailer|extra|bonus|featurette|\d{3,4}[pi]|[248]k)"
+    r"(?![^\W_])",
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
 
 
+@lru_cache(maxsize=8192)
 def _normalize_stem(stem: str) -> str:
     """Normalize filename stem for variant grouping.
 
     Strips common noise tokens like 'sample', 'trailer', 'extra',
     release group tags in brackets, resolution, and collapses whitespace.
     """
-    # Remove bracketed/parenthesized content (release groups, tags)
-    stem = re.sub(r"\[.*?\]", " ", stem)
-    stem = re.sub(r"\(.*?\)", " ", stem)
-    # Collapse whitespace and punctuation first
-    stem = re.sub(r"[._\-]+", " ", stem)
-    stem = re.sub(r"\s+", " ", stem)
-    # Remove common sample/extra keywords
-    stem = re.sub(
-        r"\b(sample|trailer|extra|bonus|featurette)\b", " ", stem, flags=re.IGNORECASE
-    )
-    # Remove resolution patterns (720p, 1080p, 2160p, 4k, etc.)
-    stem = re.sub(r"\b\d{3,4}[pi]\b", " ", stem, flags=re.IGNORECASE)
-    stem = re.sub(r"\b[248]k\b", " ", stem, flags=re.IGNORECASE)
-    # Final whitespace cleanup
-    stem = re.sub(r"\s+", " ", stem)
+    # Brackets go first so a '[...]' wins over an overlapping '(...)'.
+    stem = _BRACKETED_RE.sub(" ", stem)
+    stem = _STEM_NOISE_RE.sub(" ", stem)
+    stem = _WS_RE.sub(" ", stem)
     return stem.strip().lower()
 
 
+# (item, duration_s or None) for prefer_longest_variant grouping.
+_Variant = Tuple[Dict[str, Any], Optional[float]]
+
+
 def _mark_samples(cfg: SiftConfig, items: List[Dict[str, Any]]) -> None:
     """Mark items as samples based on duration and variant logic."""
     if not cfg.sample_detection.enabled:
@@ -69,8 +96,12 @@ def _mark_samples(cfg: SiftConfig, items: List[Dict[str, Any]]) -> None:
     if not prefer_longest:
         return
 
-    # Group items by normalized stem
-    groups: Dict[str, List[Dict[str, Any]]] = {}
+    # Group items by normalized stem, tracking each group's longest duration
+    # as we go. Most stems are unique, so a group only becomes a list once a
+    # second item shares its key; singletons are never revisited.
+    first: Dict[str, _Variant] = {}
+    groups: Dict[str, List[_Variant]] = {}
+    max_duration: Dict[str, float] = {}
     for item in items:
         if "skip_reason" in item:
             continue
@@ -78,33 +109,187 @@ def _mark_samples(cfg: SiftConfig, items: List[Dict[str, Any]]) -> None:
         if not isinstance(rel, str):
             continue
         # Strip extension before normalizing
-        stem = Path(rel).stem
+        stem = split_name(rel)[0]
         norm_key = _normalize_stem(stem)
         if not norm_key:
             continue
-        groups.setdefault(norm_key, []).append(item)
 
-    # For each group with multiple items, keep only the longest
+        ff = item.get("ffprobe")
+        dur = ff.get("duration_s") if isinstance(ff, dict) else None
+        if not isinstance(dur, (int, float)):
+            dur = None
+        elif dur > max_duration.get(norm_key, 0.0):
+            max_duration[norm_key] = dur
+
+        member = (item, dur)
+        group = groups.get(norm_key)
+        if group is not None:
+            group.append(member)
+        elif norm_key in first:
+            groups[norm_key] = [first.pop(norm_key), member]
+        else:
+            first[norm_key] = member
+
+    # Within each multi-item group, mark all but the longest as samples
     for norm_key, group_items in groups.items():
-        if len(group_items) <= 1:
-            continue
+        longest = max_duration.get(norm_key, 0.0)
+        for item, dur in group_items:
+            if dur is not None and dur < longest:
+                item["skip_reason"] = "sample_shorter_variant"
+
+
+FINGERPRINT_SAMPLE_BYTES = 1024 * 1024
 
-        # Find the longest duration
-        max_duration = 0.0
-        for item in group_items:
-            ff = item.get("ffprobe")
-            if isinstance(ff, dict):
-                dur = ff.get("duration_s")
-                if isinstance(dur, (int, float)) and dur > max_duration:
-                    max_duration = dur
 
-        # Mark all but the longest as samples
-        for item in group_items:
-            ff = item.get("ffprobe")
-            if isinstance(ff, dict):
-                dur = ff.get("duration_s")
-                if isinstance(dur, (int, float)) and dur < max_duration:
-                    item["skip_reason"] = "sample_shorter_variant"
+def _require_blake3() -> None:
+    # parse_config checks this too, but a cached or hand-built config can
+    # outlive the package being installed.
+    if blake3 is None:
+        raise ConfigError(
+            "cache.fingerprint = 'blake3' requires the blake3 package "
+            "(pip install blake3)"
+        )
+
+
+def _fingerprint(path: str, size: int, algo: str = "blake2b") -> Optional[str]:
+    """Cheap content fingerprint: `algo` over the first/last MiB plus size.
+
+    The result is prefixed with the algorithm name, so switching
+    cache.fingerprint never matches fingerprints of the other kind.
+    """
+    if algo == "blake3":
+        _require_blake3()
+        h = blake3.blake3()
+    else:
+        h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            h.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+            if size > FINGERPRINT_SAMPLE_BYTES:
+                f.seek(max(size - FINGERPRINT_SAMPLE_BYTES, FINGERPRINT_SAMPLE_BYTES))
+                h.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+    except OSError:
+        return None
+    h.update(str(size).encode("ascii"))
+    return f"{algo}:{h.hexdigest()}"
+
+
+def _previous_items(cfg: SiftConfig) -> Dict[str, Dict[str, Any]]:
+    """Index the existing cache by relpath; empty if missing or unusable."""
+    try:
+        data = cache_mod.read_cache(cfg)
+    except (FileNotFoundError, CacheError):
+        return {}
+    prev: Dict[str, Dict[str, Any]] = {}
+    for it in data.get("items") or []:
+        if isinstance(it, dict) and isinstance(it.get("relpath"), str):
+            prev[it["relpath"]] = it
+    return prev
+
+
+def _probe_one(
+    cfg: SiftConfig, entry: ScanEntry, prev: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """ffprobe + summarize a single scanned file.
+
+    Size and mtime come from the scanner's stat, so no extra syscall here.
+
+    If `prev` (the cached item for the same relpath) has an ok ffprobe
+    summary and the same size/mtime_ns, that summary is reused instead of
+    spawning ffprobe again. With cache.fingerprint enabled, a matching
+    content fingerprint also counts as unchanged (hashing only runs when
+    the size/mtime check misses or no fingerprint of that kind was cached).
+    """
+    rel, path, size, mtime_ns = entry
+    item: Dict[str, Any] = {
+        "relpath": rel,
+        "path": path,
+        "size": size,
+        "mtime_ns": mtime_ns,
+    }
+
+    prev_ff = prev.get("ffprobe") if prev else None
+    reusable = isinstance(prev_ff, dict) and prev_ff.get("ok") is True
+    unchanged = (
+        reusable
+        and prev.get("size") == item["size"]
+        and prev.get("mtime_ns") == item["mtime_ns"]
+    )
+
+    if cfg.cache.fingerprint != "off":
+        prev_fp = prev.get("fp") if prev else None
+        # A fingerprint of the other algorithm (cache.fingerprint changed)
+        # is recomputed, not carried forward.
+        same_algo = isinstance(prev_fp, str) and prev_fp.startswith(
+            f"{cfg.cache.fingerprint}:"
+        )
+        if unchanged and same_algo:
+            item["fp"] = prev_fp
+        else:
+            item["fp"] = _fingerprint(path, item["size"], cfg.cache.fingerprint)
+            if reusable and item["fp"] is not None and item["fp"] == prev_fp:
+                unchanged = True
+
+    if unchanged:
+        item["ffprobe"] = prev_ff
+    else:
+        ffj, err = run_ffprobe(cfg.ffprobe, path)
+        if err or ffj is None:
+            item["ffprobe"] = {"ok": False, "error": err}
+        else:
+            try:
+                item["ffprobe"] = summarize(ffj)
+            except (AttributeError, TypeError) as e:
+                item["ffprobe"] = {
+                    "ok": False,
+                    "error": f"unexpected ffprobe output: {e}",
+                }
+
+    # Compute the proposed name (rendered using naming templates) if possible.
+    # Transfer skips items whose probe failed, so don't render names for them.
+    if item["ffprobe"].get("ok") is True:
+        try:
+            item["proposed_name"] = render_name(cfg, item)
+        except Exception:
+            # Don't fail the scan if rendering/routing fails; proposed_name will simply be absent.
+            pass
+
+    return item
+
+
+_WORKER_CFG: Optional[SiftConfig] = None
+
+
+def _init_worker(cfg: SiftConfig) -> None:
+    # Ship the config to each worker process once, not with every task.
+    global _WORKER_CFG
+    _WORKER_CFG = cfg
+
+
+def _probe_in_worker(
+    entry: ScanEntry, prev: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    assert _WORKER_CFG is not None
+    return _probe_one(_WORKER_CFG, entry, prev)
+
+
+def _probe_executor(cfg: SiftConfig) -> Executor:
+    workers = max(1, cfg.ffprobe.jobs)
+    if cfg.ffprobe.executor == "process":
+        # build_inventory may already have threads running (earlier pools,
+        # the caller's own), and forking a threaded process can deadlock;
+        # start workers from a clean interpreter instead.
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context(
+            "forkserver" if "forkserver" in methods else "spawn"
+        )
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(cfg,),
+        )
+    return ThreadPoolExecutor(max_workers=workers)
 
 
 def build_inventory(
@@ -113,55 +298,64 @@ def build_inventory(
     rescan: bool,
     only_ext: Optional[List[str]] = None,
     limit: Optional[int] = None,
+    force_ffprobe: bool = False,
+    lazy_items: bool = False,
 ) -> Dict[str, Any]:
+    """Return the inventory payload, from cache or from a (re)scan.
+
+    A rescan reuses cached ffprobe summaries for files whose size and
+    mtime_ns are unchanged; `force_ffprobe` re-probes every file.
+    Proposed names and sample marks are always recomputed.
+
+    With `lazy_items`, an inventory loaded from the cache comes back with
+    "items" as an iterator over the cache file (cache.iter_cache_items), so
+    callers that make a single pass never hold the whole list in memory.
+    A rescan has to build the list anyway (sample marking and sorting need
+    every item), so it is returned as is rather than re-read from disk.
+    """
     if not rescan:
         try:
+            if lazy_items:
+                inv = cache_mod.read_cache_header(cfg)
+                inv["items"] = cache_mod.iter_cache_items(cfg)
+                return inv
             return cache_mod.read_cache(cfg)
         except FileNotFoundError:
             pass
 
-    media_paths = scan_files(cfg.paths.incoming, only_ext=only_ext, limit=limit)
+    if cfg.cache.fingerprint == "blake3":
+        # Fail before scanning rather than inside every probe worker.
+        _require_blake3()
+
+    prev = {} if force_ffprobe else _previous_items(cfg)
+    entries = scan_entries(
+        cfg.paths.incoming,
+        only_ext=only_ext,
+        limit=limit,
+        parallelism=cfg.io.scan_parallelism,
+    )
 
     items: List[Dict[str, Any]] = []
     errors = 0
 
-    for p in media_paths:
-        rel = str(p.relative_to(cfg.paths.incoming))
-        try:
-            st = p.stat()
-        except OSError:
-            continue
-
-        item: Dict[str, Any] = {
-            "relpath": rel,
-            "path": str(p),
-            "size": int(st.st_size),
-            "mtime_ns": int(st.st_mtime_ns),
-        }
-
-        ffj, err = run_ffprobe(cfg.ffprobe, p)
-        if err or ffj is None:
-            errors += 1
-            item["ffprobe"] = {"ok": False, "error": err}
+    # Each probe mostly waits on an ffprobe child process, so threads are
+    # usually enough; max_workers bounds how many children run at once.
+    # ffprobe.executor = "process" also moves JSON parsing/summarize off the
+    # GIL, at the cost of pickling each result back.
+    with _probe_executor(cfg) as ex:
+        if isinstance(ex, ProcessPoolExecutor):
+            futures = [ex.submit(_probe_in_worker, e, prev.get(e[0])) for e in entries]
         else:
-            item["ffprobe"] = summarize(ffj)
-
-        # Compute the proposed name (rendered using naming templates) if possible.
-        try:
-            from .router import render_name
-
-            item["proposed_name"] = render_name(cfg, item)
-        except Exception:
-            # Don't fail the scan if rendering/routing fails; proposed_name will simply be absent.
-            pass
-
-        items.append(item)
+            futures = [ex.submit(_probe_one, cfg, e, prev.get(e[0])) for e in entries]
+        for fut in as_completed(futures):
+            item = fut.result()
+            if item["ffprobe"].get("ok") is not True:
+                errors += 1
+            items.append(item)
 
     # Mark samples before caching
     _mark_samples(cfg, items)
 
     items.sort(key=lambda x: x.get("relpath", ""))
-    cache_mod.write_cache(cfg, items=items, errors=errors)
-
-    # Re-read to ensure we return exactly what was cached (contract).
-    return cache_mod.read_cache(cfg)
+    # write_cache returns the payload it wrote; no need to read it back.
+    return cache_mod.write_cache(cfg, items=items, errors=errors)
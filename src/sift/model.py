@@ -1,31 +1,108 @@
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
+from .rules import Predicate, compile_requires, literal_values
 
-@dataclass(frozen=True)
+
+# Top-level folders under outgoing_root, one per media type.
+MEDIA_TYPES = ("movies", "tv")
+
+# Resolution buckets checked against video height, highest first, with the
+# threshold used when classification.resolution.vertical_thresholds omits one.
+_VERTICAL_THRESHOLD_DEFAULTS = (("2160p", 2000), ("1080p", 1000), ("720p", 700))
+
+# Defaults for classification.tv_sxe_regex / tv_season_episode_regex.
+# The named groups let render_name read season/episode from the same pattern.
+DEFAULT_TV_SXE_REGEX = (
+    r"(?i)\bs\s*(?P<season>\d{1,2})\s*[._ -]?\s*e\s*(?P<episode>\d{1,3})\b"
+)
+DEFAULT_TV_SEASON_EPISODE_REGEX = r"(?i)\bseason\s*\d{1,2}\b.*\bepisode\s*\d{1,3}\b"
+
+# Compiled once at import; configs that keep the defaults share these objects.
+_DEFAULT_PATTERNS: Dict[str, re.Pattern[str]] = {
+    p: re.compile(p) for p in (DEFAULT_TV_SXE_REGEX, DEFAULT_TV_SEASON_EPISODE_REGEX)
+}
+
+
+def _compile(pattern: str) -> re.Pattern[str]:
+    return _DEFAULT_PATTERNS.get(pattern) or re.compile(pattern)
+
+
+def _lower_keys(d: Dict[str, str]) -> Dict[str, str]:
+    """`d` with lowercase keys; an exactly-lowercase key wins over variants."""
+    if all(k == k.lower() for k in d):
+        return d
+    out = {k.lower(): v for k, v in d.items()}
+    out.update((k, v) for k, v in d.items() if k == k.lower())
+    return out
+
+
+# Backreferences and conditionals address groups by number or name, which
+# joining several patterns into one alternation would shift or collide.
+_GROUP_REF_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def _scan_patterns(
+    patterns: Tuple[re.Pattern[str], ...],
+) -> Tuple[re.Pattern[str], ...]:
+    """Patterns to search with for an "any of these matches" test.
+
+    Several patterns become one alternation, so each text is scanned once
+    instead of once per pattern. Patterns an alternation can't hold
+    faithfully (global inline flags such as a leading (?i), group
+    references) keep the per-pattern scans.
+    """
+    if len(patterns) < 2 or any(_GROUP_REF_RE.search(p.pattern) for p in patterns):
+        return patterns
+    try:
+        return (re.compile("|".join(f"(?:{p.pattern})" for p in patterns)),)
+    except re.error:
+        return patterns
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Tuple[re.Pattern[str], ...]:
+    """Compile a regex list; raises re.error on the first invalid entry."""
+    return tuple(re.compile(pat) for pat in patterns)
+
+
+@dataclass(frozen=True, slots=True)
 class PathsConfig:
     incoming: Path
     outgoing_root: Path
     metadata_cache: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IOConfig:
     mode: str  # "move" | "copy"
     mkdirs: bool
     dedupe_on_collision: bool
+    # scan_parallelism: directories listed at once while scanning incoming.
+    scan_parallelism: int = 1
+    # transfer_parallelism: files copied at once (mode = "copy" only).
+    transfer_parallelism: int = 1
+    # preserve_metadata: copy permission bits and timestamps onto copies
+    # (including cross-device moves).
+    preserve_metadata: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FFProbeConfig:
     bin: str
     args: List[str]
+    # jobs: how many ffprobe processes may run at once during a scan.
+    jobs: int = field(default_factory=lambda: min(os.cpu_count() or 1, 8))
+    # executor: "thread" (default) or "process". Worker processes also parse
+    # ffprobe's JSON and summarize in parallel instead of under the GIL.
+    executor: str = "thread"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassificationConfig:
     media_type_strategy: str
     tv_sxe_regex: str
@@ -44,11 +121,89 @@ class ClassificationConfig:
 
     horizontal_4k_threshold: int = 3800
     vertical_thresholds: Dict[str, int] = field(
-        default_factory=lambda: {"2160p": 2000, "1080p": 1000, "720p": 700}
+        default_factory=lambda: dict(_VERTICAL_THRESHOLD_DEFAULTS)
+    )
+
+    # Compiled forms of the regex settings above, built once per config so
+    # per-file routing never goes through re's pattern cache.
+    tv_sxe_re: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    tv_season_episode_re: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    # tv_sxe_re if it names (?P<season>...) and (?P<episode>...) groups, else
+    # the default pattern; render_name parses season/episode with it.
+    sxe_parse_re: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    problem_audio_profile_res: Tuple[re.Pattern[str], ...] = field(
+        init=False, repr=False, compare=False
     )
+    hdr_side_data_res: Tuple[re.Pattern[str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # What the router actually searches with: the lists above folded into a
+    # single alternation where possible (see _scan_patterns).
+    problem_audio_profile_scan: Tuple[re.Pattern[str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    hdr_side_data_scan: Tuple[re.Pattern[str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # Lowercased lookup sets for the per-file codec/transfer checks.
+    problem_audio_codecs_lower: FrozenSet[str] = field(
+        init=False, repr=False, compare=False
+    )
+    hdr_color_transfer_lower: FrozenSet[str] = field(
+        init=False, repr=False, compare=False
+    )
+    # (label, min height) in the order the router checks them, defaults filled.
+    vertical_threshold_steps: Tuple[Tuple[str, int], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields have to be set via object.__setattr__.
+        sxe_re = _compile(self.tv_sxe_regex)
+        object.__setattr__(self, "tv_sxe_re", sxe_re)
+        if not {"season", "episode"} <= sxe_re.groupindex.keys():
+            sxe_re = _DEFAULT_PATTERNS[DEFAULT_TV_SXE_REGEX]
+        object.__setattr__(self, "sxe_parse_re", sxe_re)
+        object.__setattr__(
+            self, "tv_season_episode_re", _compile(self.tv_season_episode_regex)
+        )
+        object.__setattr__(
+            self,
+            "problem_audio_profile_res",
+            _compile_patterns(self.problem_audio_profile_regex),
+        )
+        object.__setattr__(
+            self, "hdr_side_data_res", _compile_patterns(self.hdr_side_data_regex)
+        )
+        object.__setattr__(
+            self,
+            "problem_audio_profile_scan",
+            _scan_patterns(self.problem_audio_profile_res),
+        )
+        object.__setattr__(
+            self, "hdr_side_data_scan", _scan_patterns(self.hdr_side_data_res)
+        )
+        object.__setattr__(
+            self,
+            "problem_audio_codecs_lower",
+            frozenset(x.lower() for x in self.problem_audio_codecs),
+        )
+        object.__setattr__(
+            self,
+            "hdr_color_transfer_lower",
+            frozenset(x.lower() for x in self.hdr_color_transfer),
+        )
+        object.__setattr__(
+            self,
+            "vertical_threshold_steps",
+            tuple(
+                (label, self.vertical_thresholds.get(label, default))
+                for label, default in _VERTICAL_THRESHOLD_DEFAULTS
+            ),
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NamingConfig:
     movie_template: str
     tv_template: str
@@ -60,8 +215,17 @@ class NamingConfig:
     sanitize: bool
     max_filename_len: int
 
+    # Codec maps keyed by lowercase codec name (render_name looks up
+    # codec.lower()); the configured maps themselves when already lowercase.
+    vcodec_map_lower: Dict[str, str] = field(init=False, repr=False, compare=False)
+    acodec_map_lower: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "vcodec_map_lower", _lower_keys(self.vcodec_map))
+        object.__setattr__(self, "acodec_map_lower", _lower_keys(self.acodec_map))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TierDef:
     id: str
     folder: str
@@ -69,14 +233,68 @@ class TierDef:
     requires: Dict[str, Any]
     flags: List[str]
 
+    # `requires` compiled to (fact key, predicate) pairs; None never matches.
+    requires_compiled: Optional[Tuple[Tuple[str, Predicate], ...]] = field(
+        init=False, repr=False, compare=False
+    )
 
-@dataclass(frozen=True)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "requires_compiled", compile_requires(self.requires))
+
+
+# weakref_slot: router keeps per-model tier decisions in a side table that
+# is cleared when the model is collected.
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class TierModelConfig:
     tiers: int
     tier: List[TierDef]
 
+    # Tiers worth evaluating per lowercased `res` fact, in config order:
+    # those whose requires.res can match that label plus those that don't
+    # constrain res to literals. tiers_any_res is the latter alone (for res
+    # values no tier names). Tiers whose requires can never match are dropped.
+    tiers_by_res: Dict[str, Tuple[TierDef, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    tiers_any_res: Tuple[TierDef, ...] = field(init=False, repr=False, compare=False)
+    # Fact keys any tier's requires reads; router.tier_for_item memoizes its
+    # decision per combination of their values.
+    requires_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        keyed: List[Tuple[TierDef, Optional[FrozenSet[str]]]] = []
+        for t in self.tier:
+            if t.requires_compiled is None:
+                continue
+            req = t.requires if isinstance(t.requires, dict) else {}
+            keyed.append((t, literal_values(req["res"]) if "res" in req else None))
+        labels = {label for _, values in keyed if values for label in values}
+        object.__setattr__(
+            self,
+            "tiers_by_res",
+            {
+                label: tuple(t for t, v in keyed if v is None or label in v)
+                for label in labels
+            },
+        )
+        object.__setattr__(
+            self, "tiers_any_res", tuple(t for t, v in keyed if v is None)
+        )
+        object.__setattr__(
+            self,
+            "requires_keys",
+            tuple(
+                dict.fromkeys(
+                    k
+                    for t in self.tier
+                    if isinstance(t.requires, dict)
+                    for k in t.requires
+                )
+            ),
+        )
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlagsConfig:
     enable_hfr_flag: bool
     hfr_fps_threshold: float
@@ -97,13 +315,13 @@ class FlagsConfig:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportingConfig:
     write_jsonl_report: bool
     report_path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SampleDetectionConfig:
     enabled: bool
     min_duration_s: float
@@ -111,7 +329,14 @@ class SampleDetectionConfig:
     min_video_streams: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class CacheConfig:
+    # fingerprint: "off", "blake2b" or "blake3". When enabled, each cached item carries a
+    # sampled content hash so entries survive mtime changes (copies, other hosts).
+    fingerprint: str = "off"
+
+
+@dataclass(frozen=True, slots=True)
 class SiftConfig:
     paths: PathsConfig
     io: IOConfig
@@ -122,3 +347,25 @@ class SiftConfig:
     flags: FlagsConfig
     reporting: ReportingConfig
     sample_detection: SampleDetectionConfig
+    cache: CacheConfig = field(default_factory=CacheConfig)
+
+    # Every folder sift manages (outgoing tree, metadata cache, report dir),
+    # de-duplicated and sorted once; see scaffold.planned_folders. The leaf
+    # subset is what scaffold.ensure_dirs hands to os.makedirs.
+    planned_folders: Tuple[Path, ...] = field(init=False, repr=False, compare=False)
+    leaf_folders: Tuple[Path, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        folders = [self.paths.outgoing_root, self.paths.metadata_cache]
+        if self.reporting.write_jsonl_report:
+            folders.append(self.reporting.report_path.parent)
+        for media_type in MEDIA_TYPES:
+            base = self.paths.outgoing_root / media_type
+            folders.append(base)
+            folders.extend(base / t.folder for t in self.tier_model.tier)
+        planned = tuple(sorted(set(folders), key=str))
+        ancestors = {parent for p in planned for parent in p.parents}
+        object.__setattr__(self, "planned_folders", planned)
+        object.__setattr__(
+            self, "leaf_folders", tuple(p for p in planned if p not in ancestors)
+        )
@@ -1,11 +1,38 @@
 from __future__ import annotations
 
+import os
 import re
+import threading
+import weakref
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-from .model import ClassificationConfig, SiftConfig, TierDef
+from .model import ClassificationConfig, SiftConfig, TierDef, TierModelConfig
+from .rules import requires_match
+from .utils import split_name
 
+# tier_for_item's decisions per TierModelConfig, keyed by id(model) and
+# dropped when the model is collected (so an id is never reused stale). Kept
+# off the frozen config, so it isn't pickled with it or sent to workers.
+_TIER_DECISIONS: Dict[int, Dict[Tuple[Any, ...], TierDef]] = {}
+_TIER_DECISIONS_LOCK = threading.Lock()
+
+# Upper bound on decisions kept per model (distinct fact combinations).
+_MAX_TIER_DECISIONS = 4096
+
+# Top-level incoming folder names recognized by media_type_strategy = "folder".
+_TV_FOLDERS = frozenset(("tv", "shows", "series"))
+_MOVIE_FOLDERS = frozenset(("movie", "movies", "film", "films"))
+
+# Patterns used by render_name and its helpers (compiled once, not per item).
+_SEPARATORS_RE = re.compile(r"[._\-]+")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_WS_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"\{(\w+)\}")
+_EMPTY_BRACKETS_RE = re.compile(r"\[\s*\]")
+_EMPTY_PARENS_RE = re.compile(r"\(\s*\)")
+_UNSAFE_CHARS_RE = re.compile(r"[\0<>:\"/\\|?*]")
 
 # ----------------------------
 # Helpers
@@ -23,13 +50,13 @@ def _as_int(v: Any) -> Optional[int]:
         return None
 
 
-def _get(d: Dict[str, Any], path: str) -> Any:
-    cur: Any = d
-    for part in path.split("."):
-        if not isinstance(cur, dict):
-            return None
-        cur = cur.get(part)
-    return cur
+_EMPTY: Dict[str, Any] = {}
+
+
+def _section(ff: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """ff[key] if it is a dict (summarize()'s "video"/"audio"), else {}."""
+    v = ff.get(key)
+    return v if isinstance(v, dict) else _EMPTY
 
 
 # ----------------------------
@@ -47,22 +74,20 @@ def infer_media_type(cfg: SiftConfig, item: Dict[str, Any]) -> str:
         return "movies"
 
     if strat == "folder":
-        parts = Path(rel).parts
-        if parts:
-            head = parts[0].lower()
-            if head in {"tv", "shows", "series"}:
-                return "tv"
-            if head in {"movie", "movies", "film", "films"}:
-                return "movies"
+        head = rel.split(os.sep, 1)[0].lower()
+        if head in _TV_FOLDERS:
+            return "tv"
+        if head in _MOVIE_FOLDERS:
+            return "movies"
         return "movies"
 
     if strat == "sxe":
-        name = Path(rel).name
-        if re.search(cfg.classification.tv_sxe_regex, name):
+        name = os.path.basename(rel)
+        if cfg.classification.tv_sxe_re.search(name):
             return "tv"
 
         if cfg.classification.enable_season_episode_words:
-            if re.search(cfg.classification.tv_season_episode_regex, name):
+            if cfg.classification.tv_season_episode_re.search(name):
                 return "tv"
 
         return "movies"
@@ -94,90 +119,69 @@ def _res_label_from_dimensions(
     # Otherwise use vertical resolution
     if height is None:
         return "SD"
-    if height >= cfg.vertical_thresholds.get("2160p", 2000):
-        return "2160p"
-    if height >= cfg.vertical_thresholds.get("1080p", 1000):
-        return "1080p"
-    if height >= cfg.vertical_thresholds.get("720p", 700):
-        return "720p"
+    for label, threshold in cfg.vertical_threshold_steps:
+        if height >= threshold:
+            return label
     return "SD"
 
 
-def _is_hdr(cfg: SiftConfig, item: Dict[str, Any]) -> bool:
+@lru_cache(maxsize=4096)
+def _matches_any(patterns: Tuple[re.Pattern[str], ...], text: str) -> bool:
+    """Whether any pattern matches text, lowercased.
+
+    Profiles, side data types, tags and codec/profile blobs repeat across
+    most of a library, so the regex work is memoized per distinct string.
     """
-    Best-effort HDR detection using:
+    text = text.lower()
+    return any(pat.search(text) for pat in patterns)
+
+
+def _is_hdr(cfg: SiftConfig, video: Dict[str, Any]) -> bool:
+    """
+    Best-effort HDR detection from a summarize() "video" section using:
     - video.color_transfer in hdr_color_transfer
     - side_data_types + tags/profile matched against hdr_side_data_regex
     """
-    ff = item.get("ffprobe")
-    if not isinstance(ff, dict) or ff.get("ok") is not True:
-        return False
-
-    transfer = _as_str(_get(ff, "video.color_transfer"))
-    if transfer and transfer.lower() in {
-        x.lower() for x in cfg.classification.hdr_color_transfer
-    }:
+    transfer = _as_str(video.get("color_transfer"))
+    if transfer and transfer.lower() in cfg.classification.hdr_color_transfer_lower:
         return True
 
-    # Build a searchable blob from likely HDR/DV hints
-    parts: list[str] = []
-
-    vprof = _as_str(_get(ff, "video.profile"))
-    if vprof:
-        parts.append(vprof)
+    patterns = cfg.classification.hdr_side_data_scan
+    if not patterns:
+        return False
 
-    # side_data_types from summarize()
-    sdt = _get(ff, "video.side_data_types")
+    # Match likely HDR/DV hints (profile, side_data_types and tags from
+    # summarize()) one at a time, stopping at the first hit.
+    hints: list[Any] = [_as_str(video.get("profile"))]
+    sdt = video.get("side_data_types")
     if isinstance(sdt, list):
-        parts.extend([str(x) for x in sdt])
-
-    # tags from summarize()
-    tags = _get(ff, "video.tags")
+        hints.extend(sdt)
+    tags = video.get("tags")
     if isinstance(tags, dict):
-        parts.extend([f"{k}={v}" for k, v in tags.items()])
-
-    blob = " | ".join(parts).lower()
+        hints.extend(f"{k}={v}" for k, v in tags.items())
 
-    for pat in cfg.classification.hdr_side_data_regex:
-        try:
-            if re.search(pat, blob, flags=0):
-                return True
-        except re.error:
-            # Bad regex in config should not crash routing; treat as non-match
-            continue
+    for hint in hints:
+        if hint and _matches_any(patterns, str(hint)):
+            return True
 
     return False
 
 
-def _is_problem_audio(cfg: SiftConfig, item: Dict[str, Any]) -> bool:
+def _is_problem_audio(cfg: SiftConfig, audio: Dict[str, Any]) -> bool:
     """
     Your config intent:
     - problem_audio_codecs includes truehd, etc.
     - problem_audio_profile_regex matches DTS-HD MA, etc.
-    We check codec + profile strings.
+    We check codec + profile strings of a summarize() "audio" section.
     """
-    ff = item.get("ffprobe")
-    if not isinstance(ff, dict) or ff.get("ok") is not True:
-        return False
+    acodec = _as_str(audio.get("codec"))
+    aprof = _as_str(audio.get("profile"))
 
-    acodec = _as_str(_get(ff, "audio.codec"))
-    aprof = _as_str(_get(ff, "audio.profile"))
-
-    if acodec and acodec.lower() in {
-        x.lower() for x in cfg.classification.problem_audio_codecs
-    }:
+    if acodec and acodec.lower() in cfg.classification.problem_audio_codecs_lower:
         return True
 
-    blob = " ".join([x for x in [acodec, aprof] if isinstance(x, str)]).lower()
-
-    for pat in cfg.classification.problem_audio_profile_regex:
-        try:
-            if re.search(pat, blob, flags=0):
-                return True
-        except re.error:
-            continue
-
-    return False
+    blob = " ".join([x for x in [acodec, aprof] if isinstance(x, str)])
+    return _matches_any(cfg.classification.problem_audio_profile_scan, blob)
 
 
 def derive_facts(cfg: SiftConfig, item: Dict[str, Any]) -> Dict[str, Any]:
@@ -197,15 +201,17 @@ def derive_facts(cfg: SiftConfig, item: Dict[str, Any]) -> Dict[str, Any]:
             "problem_audio": False,
         }
 
-    width = _as_int(_get(ff, "video.width"))
-    height = _as_int(_get(ff, "video.height"))
+    video = _section(ff, "video")
+    audio = _section(ff, "audio")
+    width = _as_int(video.get("width"))
+    height = _as_int(video.get("height"))
     facts = {
         "res": _res_label_from_dimensions(cfg.classification, width, height),
-        "hdr": _is_hdr(cfg, item),
-        "vcodec": _as_str(_get(ff, "video.codec")),
-        "acodec": _as_str(_get(ff, "audio.codec")),
-        "min_audio_channels": _as_int(_get(ff, "audio.channels")) or 0,
-        "problem_audio": _is_problem_audio(cfg, item),
+        "hdr": _is_hdr(cfg, video),
+        "vcodec": _as_str(video.get("codec")),
+        "acodec": _as_str(audio.get("codec")),
+        "min_audio_channels": _as_int(audio.get("channels")) or 0,
+        "problem_audio": _is_problem_audio(cfg, audio),
     }
     return facts
 
@@ -215,52 +221,11 @@ def derive_facts(cfg: SiftConfig, item: Dict[str, Any]) -> Dict[str, Any]:
 # ----------------------------
 
 
-def _match_value(actual: Any, rule: Any) -> bool:
-    """
-    Minimal matching for your current config:
-
-    - str/bool/int: equality (case-insensitive for strings)
-    - list: membership (case-insensitive for strings)
-    - dict (optional): supports {"min": N} / {"max": N}, {"regex": "..."}, {"eq": X}
-    """
-    if isinstance(rule, dict):
-        if "eq" in rule:
-            return _match_value(actual, rule["eq"])
-        if "min" in rule or "max" in rule:
-            a = _as_int(actual)
-            if a is None:
-                return False
-            if "min" in rule and a < int(rule["min"]):
-                return False
-            if "max" in rule and a > int(rule["max"]):
-                return False
-            return True
-        if "regex" in rule:
-            pat = rule.get("regex")
-            s = _as_str(actual)
-            if not isinstance(pat, str) or s is None:
-                return False
-            try:
-                return re.search(pat, s) is not None
-            except re.error:
-                return False
-        return False
-
-    if isinstance(rule, list):
-        if actual is None:
-            return False
-        if isinstance(actual, str):
-            a = actual.lower()
-            return any(isinstance(x, str) and x.lower() == a for x in rule)
-        return actual in rule
-
-    if isinstance(rule, str):
-        return isinstance(actual, str) and actual.lower() == rule.lower()
-
-    return actual == rule
-
-
-def tier_for_item(cfg: SiftConfig, item: Dict[str, Any]) -> TierDef:
+def tier_for_item(
+    cfg: SiftConfig,
+    item: Dict[str, Any],
+    facts: Optional[Dict[str, Any]] = None,
+) -> TierDef:
     """
     Select the first matching tier in config order, using derived facts that match config.toml.
 
@@ -268,30 +233,56 @@ def tier_for_item(cfg: SiftConfig, item: Dict[str, Any]) -> TierDef:
     - Match is evaluated against derive_facts(cfg, item)
     - T5 is NOT a fallback bucket. It only matches when its requires evaluate true.
     - If nothing matches, fall back to T4 if present, else the last tier.
-    """
-    facts = derive_facts(cfg, item)
 
-    # Evaluate tiers in order
-    for t in cfg.tier_model.tier:
-        req = t.requires
-        if req is None:
-            req = {}
-        if not isinstance(req, dict):
-            # bad config shouldn't silently route to T5; treat as non-match
-            continue
-
-        # Empty requires => unconditional match (if you ever add a catch-all tier)
-        if len(req) == 0:
-            return t
-
-        ok = True
-        for key, rule in req.items():
-            actual = facts.get(key)
-            if not _match_value(actual, rule):
-                ok = False
-                break
+    Pass `facts` when the caller already has derive_facts(cfg, item).
+    """
+    if facts is None:
+        facts = derive_facts(cfg, item)
 
-        if ok:
+    # Items with the same values for the facts tier rules read get the same
+    # tier; most of a library shares a handful of combinations.
+    model = cfg.tier_model
+    decisions = _tier_decisions(model)
+    try:
+        key: Optional[Tuple[Any, ...]] = tuple(
+            facts.get(k) for k in model.requires_keys
+        )
+        tier = decisions.get(key)
+    except TypeError:  # an unhashable fact value
+        key = tier = None
+    if tier is None:
+        tier = _select_tier(cfg, facts)
+        if key is not None:
+            with _TIER_DECISIONS_LOCK:
+                if len(decisions) < _MAX_TIER_DECISIONS:
+                    decisions[key] = tier
+    return tier
+
+
+def _tier_decisions(model: TierModelConfig) -> Dict[Tuple[Any, ...], TierDef]:
+    decisions = _TIER_DECISIONS.get(id(model))
+    if decisions is None:
+        with _TIER_DECISIONS_LOCK:
+            decisions = _TIER_DECISIONS.get(id(model))
+            if decisions is None:
+                decisions = _TIER_DECISIONS[id(model)] = {}
+                weakref.finalize(model, _TIER_DECISIONS.pop, id(model), None)
+    return decisions
+
+
+def _select_tier(cfg: SiftConfig, facts: Dict[str, Any]) -> TierDef:
+    # Evaluate tiers in order; requires tables were compiled at config load.
+    # Empty requires => unconditional match (if you ever add a catch-all tier);
+    # a malformed one never matches rather than silently routing to T5.
+    # Tiers whose requires.res can't match this item's res are skipped.
+    model = cfg.tier_model
+    res = facts.get("res")
+    if isinstance(res, str):
+        candidates = model.tiers_by_res.get(res.lower(), model.tiers_any_res)
+    else:
+        candidates = model.tiers_any_res
+    for t in candidates:
+        if requires_match(t.requires_compiled, facts):
             return t
 
     # Fallback: prefer T4 if present, otherwise last tier
@@ -307,32 +298,32 @@ def tier_for_item(cfg: SiftConfig, item: Dict[str, Any]) -> TierDef:
 # ----------------------------
 
 
-def _parse_sxe_from_name(name: str):
-    """Return (show, season2, episode2) or (None, None, None) if not found."""
-    import re
+def _parse_sxe_from_name(name: str, sxe_re: re.Pattern[str]):
+    """Return (show, season2, episode2) or (None, None, None) if not found.
 
-    m = re.search(r"(?i)\bs\s*(\d{1,2})\s*[._ -]?\s*e\s*(\d{1,3})\b", name)
+    `sxe_re` must define (?P<season>...) and (?P<episode>...) groups
+    (ClassificationConfig.sxe_parse_re).
+    """
+    m = sxe_re.search(name)
     if not m:
         return None, None, None
-    s = int(m.group(1))
-    e = int(m.group(2))
+    s = int(m.group("season"))
+    e = int(m.group("episode"))
     # show is the part before the match
     show = name[: m.start()].strip()
     # cleanup separators
-    show = re.sub(r"[._\-]+", " ", show).strip()
+    show = _SEPARATORS_RE.sub(" ", show).strip()
     return show or None, f"{s:02d}", f"{e:02d}"
 
 
 def _sanitize_filename(name: str) -> str:
     # Minimal sanitization: remove path separators and control chars
-    import re
-
     # Replace path separators
     name = name.replace("/", "_").replace("\\", "_")
     # Collapse multiple whitespace
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _WS_RE.sub(" ", name).strip()
     # Remove characters not generally safe in filenames
-    name = re.sub(r"[\0<>:\"/\\|?*]", "", name)
+    name = _UNSAFE_CHARS_RE.sub("", name)
     return name
 
 
@@ -344,14 +335,12 @@ def render_name(cfg: SiftConfig, item: Dict[str, Any]) -> str:
     facts (res, hdr, vcodec, acodec, audio channels). Honors
     `fallback_to_stem` and `sanitize` config.
     """
-    from pathlib import Path
-
     rel = item.get("relpath")
     if not isinstance(rel, str) or not rel:
         raise ValueError("inventory item missing relpath")
 
-    stem = Path(rel).stem
-    ext = Path(rel).suffix.lstrip(".")
+    stem, suffix = split_name(rel)
+    ext = suffix.lstrip(".")
 
     # derive basic facts
     facts = derive_facts(cfg, item)
@@ -364,7 +353,9 @@ def render_name(cfg: SiftConfig, item: Dict[str, Any]) -> str:
     episode2 = None
 
     # Try TV SXE detection
-    show, season2, episode2 = _parse_sxe_from_name(stem)
+    show, season2, episode2 = _parse_sxe_from_name(
+        stem, cfg.classification.sxe_parse_re
+    )
 
     if show:
         # TV template selected
@@ -372,14 +363,12 @@ def render_name(cfg: SiftConfig, item: Dict[str, Any]) -> str:
     else:
         template = cfg.naming.movie_template
         # Try naive year extraction (4-digit year)
-        import re
-
-        ym = re.search(r"\b(19|20)\d{2}\b", stem)
+        ym = _YEAR_RE.search(stem)
         if ym:
             year = ym.group(0)
             # title is part before year
             title = stem[: ym.start()].strip()
-            title = re.sub(r"[._\-]+", " ", title).strip() or None
+            title = _SEPARATORS_RE.sub(" ", title).strip() or None
 
     # Fallback to stem for title/show when configured
     if cfg.naming.fallback_to_stem:
@@ -394,9 +383,13 @@ def render_name(cfg: SiftConfig, item: Dict[str, Any]) -> str:
     vcodec_tag = ""
     acodec_tag = ""
     if isinstance(vcode, str):
-        vcodec_tag = cfg.naming.vcodec_map.get(vcode.lower(), (vcode or "").upper())
+        vcodec_tag = cfg.naming.vcodec_map_lower.get(
+            vcode.lower(), (vcode or "").upper()
+        )
     if isinstance(acode, str):
-        acodec_tag = cfg.naming.acodec_map.get(acode.lower(), (acode or "").upper())
+        acodec_tag = cfg.naming.acodec_map_lower.get(
+            acode.lower(), (acode or "").upper()
+        )
 
     # expose audio codec as an explicit token so templates can include it
     # directly (e.g., '{audio_codec}'). The numeric channel-count token
@@ -424,15 +417,9 @@ def render_name(cfg: SiftConfig, item: Dict[str, Any]) -> str:
     # hdr string
     hdr = "HDR" if facts.get("hdr") else ""
 
-    # flags: include tier flags if available in item, but filter out judgement flags
-    flags_val = ""
-    t = None
-    try:
-        # attempt to find tier from routing
-        media_type, tier, _, _ = route_destination(cfg, item)
-        t = tier
-    except Exception:
-        t = None
+    # flags: include the tier's flags (tier picked from the facts derived
+    # above), but filter out judgement flags
+    t = tier_for_item(cfg, item, facts)
 
     # Filter out "judgement" flags that shouldn't appear in filenames; this is
     # configurable in your TOML via flags.judgement_flags
@@ -492,17 +479,14 @@ def render_name(cfg: SiftConfig, item: Dict[str, Any]) -> str:
         "ext": ext or "",
     }
 
-    name = template
-    for k, v in repl.items():
-        name = name.replace("{" + k + "}", str(v))
+    # One pass over the template; unknown {tokens} are left as written.
+    name = _TOKEN_RE.sub(lambda m: str(repl.get(m.group(1), m.group(0))), template)
 
     # Clean up: collapse whitespace and remove empty bracket pairs
-    import re
-
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _WS_RE.sub(" ", name).strip()
     # Remove empty brackets like [ ] or ()
-    name = re.sub(r"\[\s*\]", "", name)
-    name = re.sub(r"\(\s*\)", "", name)
+    name = _EMPTY_BRACKETS_RE.sub("", name)
+    name = _EMPTY_PARENS_RE.sub("", name)
     name = name.strip()
 
     if cfg.naming.sanitize:
@@ -530,7 +514,7 @@ def route_destination(
         raise ValueError("inventory item missing relpath")
 
     media_type = infer_media_type(cfg, item)
-    tier = tier_for_item(cfg, item)
     facts = derive_facts(cfg, item)
+    tier = tier_for_item(cfg, item, facts)
 
     return media_type, tier, Path(rel), facts
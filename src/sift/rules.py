@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import re
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# A compiled rule: called with the fact value, returns whether it matches.
+Predicate = Callable[[Any], bool]
+
+
+def _as_str(v: Any) -> Optional[str]:
+    return v if isinstance(v, str) else None
+
+
+def _as_int(v: Any) -> Optional[int]:
+    try:
+        return int(v)
+    except Exception:
+        return None
+
+
+def match_value(actual: Any, rule: Any) -> bool:
+    """
+    Minimal matching for your current config:
+
+    - str/bool/int: equality (case-insensitive for strings)
+    - list: membership (case-insensitive for strings)
+    - dict (optional): supports {"min": N} / {"max": N}, {"regex": "..."}, {"eq": X}
+    """
+    if isinstance(rule, dict):
+        if "eq" in rule:
+            return match_value(actual, rule["eq"])
+        if "min" in rule or "max" in rule:
+            a = _as_int(actual)
+            if a is None:
+                return False
+            if "min" in rule and a < int(rule["min"]):
+                return False
+            if "max" in rule and a > int(rule["max"]):
+                return False
+            return True
+        if "regex" in rule:
+            pat = rule.get("regex")
+            s = _as_str(actual)
+            if not isinstance(pat, str) or s is None:
+                return False
+            try:
+                return re.search(pat, s) is not None
+            except re.error:
+                return False
+        return False
+
+    if isinstance(rule, list):
+        if actual is None:
+            return False
+        if isinstance(actual, str):
+            a = actual.lower()
+            return any(isinstance(x, str) and x.lower() == a for x in rule)
+        return actual in rule
+
+    if isinstance(rule, str):
+        return isinstance(actual, str) and actual.lower() == rule.lower()
+
+    return actual == rule
+
+
+# Specialized forms of match_value's branches. Rules are bound with
+# functools.partial (not closures) so compiled tiers stay picklable for the
+# on-disk config cache.
+
+
+def _never(actual: Any) -> bool:
+    return False
+
+
+def _generic(rule: Any, actual: Any) -> bool:
+    return match_value(actual, rule)
+
+
+def _equals(rule: Any, actual: Any) -> bool:
+    return actual == rule
+
+
+def _str_equals(lowered: str, actual: Any) -> bool:
+    return isinstance(actual, str) and actual.lower() == lowered
+
+
+def _member(lowered: frozenset[str], members: Tuple[Any, ...], actual: Any) -> bool:
+    if actual is None:
+        return False
+    if isinstance(actual, str):
+        return actual.lower() in lowered
+    return actual in members
+
+
+def _in_range(lo: Optional[int], hi: Optional[int], actual: Any) -> bool:
+    a = _as_int(actual)
+    if a is None:
+        return False
+    if lo is not None and a < lo:
+        return False
+    if hi is not None and a > hi:
+        return False
+    return True
+
+
+def _regex(pattern: re.Pattern[str], actual: Any) -> bool:
+    return isinstance(actual, str) and pattern.search(actual) is not None
+
+
+def compile_rule(rule: Any) -> Predicate:
+    """Return a predicate equivalent to `lambda actual: match_value(actual, rule)`.
+
+    Type dispatch, lowercasing, int() conversion and regex compilation happen
+    here once instead of per item. Rules whose bounds don't convert keep the
+    generic path, so they fail the same way at match time as before.
+    """
+    if isinstance(rule, dict):
+        if "eq" in rule:
+            return compile_rule(rule["eq"])
+        if "min" in rule or "max" in rule:
+            try:
+                lo = int(rule["min"]) if "min" in rule else None
+                hi = int(rule["max"]) if "max" in rule else None
+            except (TypeError, ValueError):
+                return partial(_generic, rule)
+            return partial(_in_range, lo, hi)
+        if "regex" in rule:
+            pat = rule.get("regex")
+            if not isinstance(pat, str):
+                return _never
+            try:
+                return partial(_regex, re.compile(pat))
+            except re.error:
+                return _never
+        return _never
+
+    if isinstance(rule, list):
+        lowered = frozenset(x.lower() for x in rule if isinstance(x, str))
+        return partial(_member, lowered, tuple(rule))
+
+    if isinstance(rule, str):
+        return partial(_str_equals, rule.lower())
+
+    return partial(_equals, rule)
+
+
+def literal_values(rule: Any) -> Optional[frozenset[str]]:
+    """Lowercased strings a rule can match, or None if it isn't that narrow.
+
+    Only plain string / list-of-strings rules (optionally under {"eq": ...})
+    qualify: they can only ever match a string equal to one of these values,
+    case-insensitively.
+    """
+    if isinstance(rule, dict):
+        return literal_values(rule["eq"]) if "eq" in rule else None
+    if isinstance(rule, str):
+        return frozenset((rule.lower(),))
+    if isinstance(rule, list) and all(isinstance(x, str) for x in rule):
+        return frozenset(x.lower() for x in rule)
+    return None
+
+
+def compile_requires(requires: Any) -> Optional[Tuple[Tuple[str, Predicate], ...]]:
+    """Compile a tier's `requires` table into (fact key, predicate) pairs.
+
+    None/empty means an unconditional match (empty tuple); anything other
+    than a table can never match and compiles to None.
+    """
+    if requires is None:
+        return ()
+    if not isinstance(requires, dict):
+        return None
+    compiled: List[Tuple[str, Predicate]] = []
+    for key, rule in requires.items():
+        compiled.append((key, compile_rule(rule)))
+    return tuple(compiled)
+
+
+def requires_match(
+    compiled: Optional[Tuple[Tuple[str, Predicate], ...]], facts: Dict[str, Any]
+) -> bool:
+    """Evaluate compile_requires() output against derived facts."""
+    if compiled is None:
+        return False
+    for key, pred in compiled:
+        if not pred(facts.get(key)):
+            return False
+    return True
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -7,36 +8,20 @@ from .model import SiftConfig
 
 
 def ensure_dirs(cfg: SiftConfig) -> List[Path]:
-    ensured: List[Path] = []
+    """Create the output tree; returns every folder it ensured.
 
-    def _mk(p: Path) -> None:
-        p.mkdir(parents=True, exist_ok=True)
-        ensured.append(p)
+    Only leaf folders are passed to os.makedirs -- their parents
+    (outgoing_root, movies/, tv/) are created along the way, so no
+    directory is stat'ed or mkdir'ed twice. On later runs the tree already
+    exists, and a single stat per leaf settles it (makedirs would spend
+    three syscalls finding that out).
+    """
+    for p in cfg.leaf_folders:
+        if not os.path.isdir(p):
+            os.makedirs(p, exist_ok=True)
 
-    _mk(cfg.paths.outgoing_root)
-    _mk(cfg.paths.metadata_cache)
-
-    if cfg.reporting.write_jsonl_report:
-        _mk(cfg.reporting.report_path.parent)
-
-    for media_type in ("movies", "tv"):
-        base = cfg.paths.outgoing_root / media_type
-        _mk(base)
-        for t in cfg.tier_model.tier:
-            _mk(base / t.folder)
-
-    return ensured
+    return list(cfg.planned_folders)
 
 
 def planned_folders(cfg: SiftConfig) -> List[Path]:
-    folders: List[Path] = [cfg.paths.outgoing_root, cfg.paths.metadata_cache]
-    if cfg.reporting.write_jsonl_report:
-        folders.append(cfg.reporting.report_path.parent)
-
-    for media_type in ("movies", "tv"):
-        base = cfg.paths.outgoing_root / media_type
-        folders.append(base)
-        for t in cfg.tier_model.tier:
-            folders.append(base / t.folder)
-
-    return sorted(set(folders), key=lambda p: str(p))
+    return list(cfg.planned_folders)
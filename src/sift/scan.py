@@ -1,33 +1,126 @@
 from __future__ import annotations
 
+import heapq
+import os
+import stat
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from .errors import ConfigError
 
 
-def scan_files(
+ScanEntry = Tuple[str, str, int, int]  # (relpath, path, size, mtime_ns)
+
+
+def _scan_dir(
+    path: str, prefix_len: int, suffixes: Optional[frozenset[str]]
+) -> Tuple[List[ScanEntry], List[str]]:
+    """List one directory: (ScanEntry per regular file, subdirectory paths).
+
+    DirEntry answers is_dir from the directory listing on most filesystems,
+    and the one stat() per matching file (cached on the DirEntry) doubles as
+    the regular-file check and the size/mtime the inventory records.
+    Directory symlinks are not followed (same as rglob); file symlinks are,
+    and unreadable entries are skipped.
+    """
+    files: List[ScanEntry] = []
+    dirs: List[str] = []
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return files, dirs
+    with it:
+        for e in it:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    dirs.append(e.path)
+                    continue
+                if suffixes is not None:
+                    name = e.name
+                    dot = name.rfind(".")
+                    if dot <= 0 or name[dot:].lower() not in suffixes:
+                        continue
+                st = e.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            files.append((e.path[prefix_len:], e.path, st.st_size, st.st_mtime_ns))
+    return files, dirs
+
+
+def _walk_files(root: str, suffixes: Optional[frozenset[str]]) -> Iterator[ScanEntry]:
+    """Yield a ScanEntry for every regular file under root, unordered."""
+    prefix_len = len(os.path.join(root, ""))
+    stack = [root]
+    while stack:
+        files, dirs = _scan_dir(stack.pop(), prefix_len, suffixes)
+        stack.extend(dirs)
+        yield from files
+
+
+def _walk_files_parallel(
+    root: str, suffixes: Optional[frozenset[str]], workers: int
+) -> Iterator[ScanEntry]:
+    """_walk_files with up to `workers` directories listed at once.
+
+    On network shares each scandir() mostly waits on round trips, so
+    listing directories concurrently turns that latency into throughput.
+    """
+    prefix_len = len(os.path.join(root, ""))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_dir, root, prefix_len, suffixes)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                files, dirs = fut.result()
+                for d in dirs:
+                    pending.add(pool.submit(_scan_dir, d, prefix_len, suffixes))
+                yield from files
+
+
+def scan_entries(
     incoming_root: Path,
     *,
     only_ext: Optional[List[str]] = None,
     limit: Optional[int] = None,
-) -> List[Path]:
+    parallelism: int = 1,
+) -> List[ScanEntry]:
+    """Sorted ScanEntry tuples for media under incoming_root.
+
+    This is what build_inventory iterates; use scan_files for Path objects.
+    parallelism > 1 lists that many directories at once (io.scan_parallelism);
+    the result is the same either way.
+    """
     if not incoming_root.exists():
         raise ConfigError(f"paths.incoming does not exist: {incoming_root}")
     if not incoming_root.is_dir():
         raise ConfigError(f"paths.incoming is not a directory: {incoming_root}")
 
-    exts_norm: Optional[set[str]] = None
+    # Normalized once to ".ext" so the walk compares name[dot:] directly.
+    suffixes: Optional[frozenset[str]] = None
     if only_ext:
-        exts_norm = {e.lower().lstrip(".") for e in only_ext if e.strip()}
-
-    paths = [p for p in incoming_root.rglob("*") if p.is_file()]
-    paths.sort(key=lambda p: str(p.relative_to(incoming_root)))
-
-    if exts_norm is not None:
-        paths = [p for p in paths if p.suffix.lower().lstrip(".") in exts_norm]
+        suffixes = frozenset(
+            "." + e.strip().lower().lstrip(".") for e in only_ext if e.strip()
+        )
 
+    if parallelism > 1:
+        entries = _walk_files_parallel(str(incoming_root), suffixes, parallelism)
+    else:
+        entries = _walk_files(str(incoming_root), suffixes)
     if limit is not None and limit >= 0:
-        paths = paths[:limit]
+        # Only the first `limit` relpaths are kept while walking: O(limit)
+        # memory instead of holding (and sorting) the whole tree.
+        return heapq.nsmallest(limit, entries)
+    return sorted(entries)
+
 
-    return paths
+def scan_files(
+    incoming_root: Path,
+    *,
+    only_ext: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+) -> List[Path]:
+    found = scan_entries(incoming_root, only_ext=only_ext, limit=limit)
+    return [Path(e[1]) for e in found]
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import errno
 import os
+import queue
 import re
-import shutil
+import stat
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .model import SiftConfig
 from .router import route_destination
+from .utils import split_name
 
 
 @dataclass(frozen=True)
@@ -26,48 +32,213 @@ def _ensure_parent(dst: Path, *, mkdirs: bool) -> None:
         dst.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _copy_with_progress(src: Path, dst: Path, *, chunk_size: int = 1024 * 1024) -> None:
+def _copy_file_range(src_fd: int, dst_fd: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count)
+
+
+def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+
+# In-kernel copies, best first: copy_file_range (Linux >= 4.5; may reflink on
+# XFS/Btrfs) then sendfile (Linux allows a regular file as the target).
+_KERNEL_COPIES: List[Callable[[int, int, int], int]] = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIES.append(_copy_file_range)
+if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+    _KERNEL_COPIES.append(_sendfile)
+
+# Errors meaning "this call can't copy between these files" (cross-device on
+# older kernels, unsupported filesystem, seccomp, ...): try the next method.
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    (errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EPERM)
+)
+
+_KERNEL_CHUNK = 8 * 1024 * 1024
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """posix_fadvise(fd, 0, 0, advice) where supported; purely a hint."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+# Below this, a reader thread costs more than overlapping reads and writes saves.
+_PIPELINE_MIN_SIZE = 32 * 1024 * 1024
+
+
+def _pipelined_read_write(
+    inf: IO[bytes], outf: IO[bytes], chunk_size: int
+) -> Iterator[int]:
+    """read/write loop where a reader thread fills the next chunk while the
+    current one is written (two reused buffers, so at most 2 * chunk_size
+    in memory). Yields byte counts as they are written.
+    """
+    free: queue.Queue[Any] = queue.Queue()
+    filled: queue.Queue[Any] = queue.Queue()
+    for _ in range(2):
+        free.put(bytearray(chunk_size))
+
+    def reader() -> None:
+        try:
+            while True:
+                buf = free.get()
+                if buf is None:
+                    return
+                n = inf.readinto(buf)
+                filled.put((buf, n))
+                if not n:
+                    return
+        except BaseException as e:
+            filled.put(e)
+
+    t = threading.Thread(target=reader, name="sift-copy-reader", daemon=True)
+    t.start()
+    try:
+        while True:
+            got = filled.get()
+            if isinstance(got, BaseException):
+                raise got
+            buf, n = got
+            if not n:
+                return
+            outf.write(memoryview(buf)[:n])
+            free.put(buf)
+            yield n
+    finally:
+        free.put(None)  # stops the reader if it's still waiting for a buffer
+        t.join()
+
+
+def _copy_steps(
+    inf: IO[bytes], outf: IO[bytes], chunk_size: int, total: int = 0
+) -> Iterator[int]:
+    """Copy inf to outf, yielding the byte count of each step.
+
+    Bytes stay in the kernel where the platform allows; otherwise (or if the
+    filesystems refuse) this falls back to read/write in chunk_size pieces,
+    pipelined for files of at least _PIPELINE_MIN_SIZE (total bytes).
+    Every method advances both file offsets, so a fallback midway continues
+    where the previous one stopped. A kernel copy that stops short of total
+    hands over to read/write rather than ending the copy.
+    """
+    src_fd, dst_fd = inf.fileno(), outf.fileno()
+    copied = 0
+    for copy in _KERNEL_COPIES:
+        try:
+            while True:
+                n = copy(src_fd, dst_fd, _KERNEL_CHUNK)
+                if n == 0:
+                    break
+                copied += n
+                yield n
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            continue
+        if copied >= total:
+            return
+        # Some filesystems report 0 ("nothing copied") instead of an error;
+        # short of the stat() size, that isn't EOF. Let read/write finish.
+        break
+
+    if total >= _PIPELINE_MIN_SIZE:
+        yield from _pipelined_read_write(inf, outf, chunk_size)
+        return
+
+    while True:
+        chunk = inf.read(chunk_size)
+        if not chunk:
+            return
+        outf.write(chunk)
+        yield len(chunk)
+
+
+# Files smaller than this only report their completion.
+_PROGRESS_MIN_SIZE = 50 * 1024 * 1024
+
+
+def _copy_with_progress(
+    src: Path,
+    dst: Path,
+    *,
+    chunk_size: int = 8 * 1024 * 1024,
+    src_stat: Optional[os.stat_result] = None,
+    preserve_metadata: bool = True,
+) -> None:
     """Copy file in chunks and print progress (percentage, MB/s, ETA).
 
-    Raises any exception encountered; preserves file metadata with copystat on success.
+    Raises any exception encountered, including OSError(EIO) when dst doesn't
+    end up src_stat's size; on success copies src's permission bits and
+    timestamps to dst unless preserve_metadata is False.
+    Pass src_stat when the caller has already stat()ed src.
     """
-    total = src.stat().st_size
+    if src_stat is None:
+        src_stat = src.stat()
+    total = src_stat.st_size
     copied = 0
     start = time.monotonic()
-    last_print_pct = -1
+    # Report at each 10% of the file, or only on completion for small files;
+    # in between, a chunk costs one comparison.
+    if total >= _PROGRESS_MIN_SIZE:
+        step = total // 10
+    else:
+        step = max(total, 1)
+    next_report = step
 
     # Ensure parent dir exists for the destination (caller should have created it already)
     with src.open("rb") as inf, dst.open("wb") as outf:
-        while True:
-            chunk = inf.read(chunk_size)
-            if not chunk:
-                break
-            outf.write(chunk)
-            copied += len(chunk)
-
-            # Print every 10% boundary or at completion
-            if total > 0:
-                pct = int(copied * 100 / total)
-            else:
-                pct = 100
-
-            if pct != last_print_pct and (pct % 10 == 0 or pct == 100):
-                elapsed = time.monotonic() - start
-                rate = copied / elapsed if elapsed > 0 else 0.0
-                rem = max(total - copied, 0)
-                eta = int(rem / rate) if rate > 0 else None
-                copied_mb = copied / (1024 * 1024)
-                total_mb = total / (1024 * 1024) if total > 0 else 0.0
-                rate_mb = rate / (1024 * 1024)
-                eta_s = f"{eta}s" if eta is not None else "??s"
-                print(
-                    f"[sift] transfer: copying {src.name} — {pct}% ({copied_mb:.1f}/{total_mb:.1f} MB) @ {rate_mb:.2f} MB/s ETA {eta_s}",
-                    flush=True,
-                )
-                last_print_pct = pct
+        # Read ahead aggressively, and don't keep a file sift won't re-read
+        # in the page cache once it's copied.
+        _fadvise(inf.fileno(), "POSIX_FADV_SEQUENTIAL")
+        for n in _copy_steps(inf, outf, chunk_size, total):
+            copied += n
+            if copied < next_report:
+                continue
+            next_report = (copied // step + 1) * step
+
+            pct = int(copied * 100 / total) if total > 0 else 100
+            elapsed = time.monotonic() - start
+            rate = copied / elapsed if elapsed > 0 else 0.0
+            rem = max(total - copied, 0)
+            eta = int(rem / rate) if rate > 0 else None
+            copied_mb = copied / (1024 * 1024)
+            total_mb = total / (1024 * 1024) if total > 0 else 0.0
+            rate_mb = rate / (1024 * 1024)
+            eta_s = f"{eta}s" if eta is not None else "??s"
+            print(
+                f"[sift] transfer: copying {src.name} — {pct}% ({copied_mb:.1f}/{total_mb:.1f} MB) @ {rate_mb:.2f} MB/s ETA {eta_s}",
+                flush=True,
+            )
+        _fadvise(inf.fileno(), "POSIX_FADV_DONTNEED")
+
+    # Never report (or, for moves, delete the source after) a short copy. The
+    # partial file is removed so a later run doesn't take it as processed.
+    written = dst.stat().st_size
+    if written != total:
+        dst.unlink()
+        raise OSError(
+            errno.EIO, f"copied {written} of {total} bytes from {src}", str(dst)
+        )
 
-    # Preserve metadata like permissions/times; allow this to raise if it fails
-    shutil.copystat(src, dst)
+    if preserve_metadata:
+        _preserve_metadata(dst, src_stat)
+
+
+def _preserve_metadata(dst: Path, src_stat: os.stat_result) -> None:
+    """Give dst src's permission bits and access/modification times.
+
+    Taken from the stat the copy already made, so unlike shutil.copystat
+    this doesn't stat src again or walk its extended attributes. Raises if
+    either call fails.
+    """
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
 
 
 def _dedup_path(dst: Path) -> Path:
@@ -93,28 +264,70 @@ def _same_file(src: Path, dst: Path) -> bool:
         return False
 
 
-def _find_existing_variant(dst: Path) -> Path | None:
+# The " (n)" _dedup_path inserts between a name's stem and suffix.
+_DEDUP_MARK_RE = re.compile(r" \((\d+)\)")
+
+
+def _index_keys(name: str) -> List[str]:
+    """Destination names an existing file `name` answers for: its own name
+    and every name it is a _dedup_path variant of ("movie (1).mkv" answers
+    for "movie.mkv").
+    """
+    keys = [name]
+    for m in _DEDUP_MARK_RE.finditer(name):
+        stem, suffix = name[: m.start()], name[m.end() :]
+        if split_name(stem + suffix) == (stem, suffix):
+            keys.append(stem + suffix)
+    return keys
+
+
+def _index_name(index: Dict[str, str], name: str) -> None:
+    """Record an existing file `name` in a _dir_index() mapping."""
+    keys = _index_keys(name)
+    index[name] = name
+    for key in keys[1:]:
+        index.setdefault(key, name)
+
+
+def _dir_index(parent: Path) -> Dict[str, str]:
+    """Destination name -> existing file in parent, from one directory listing."""
+    index: Dict[str, str] = {}
+    try:
+        it = os.scandir(parent)
+    except OSError:
+        return index
+    with it:
+        for e in it:
+            try:
+                if not e.is_file():
+                    continue
+            except OSError:
+                continue
+            _index_name(index, e.name)
+    return index
+
+
+def _find_existing_variant(
+    dst: Path, dir_index: Dict[Path, Dict[str, str]]
+) -> Path | None:
     """Return an existing file that matches dst or a deduped variant.
 
     Looks in the destination's parent directory for either the exact
     destination name or names produced by _dedup_path ("name (n).ext").
+    Each parent is listed once per run; dir_index holds the listings.
     """
-
     parent = dst.parent
-    if not parent.exists():
-        return None
+    index = dir_index.get(parent)
+    if index is None:
+        index = dir_index[parent] = _dir_index(parent)
+    name = index.get(dst.name)
+    return parent / name if name is not None else None
 
-    stem = dst.stem
-    suffix = dst.suffix
-    dedup_pat = re.compile(rf"^{re.escape(stem)} \((\d+)\){re.escape(suffix)}$")
 
-    for p in parent.iterdir():
-        if not p.is_file():
-            continue
-        name = p.name
-        if name == dst.name or dedup_pat.match(name):
-            return p
-    return None
+def _record_written(dir_index: Dict[Path, Dict[str, str]], dst: Path) -> None:
+    index = dir_index.get(dst.parent)
+    if index is not None:
+        _index_name(index, dst.name)
 
 
 def compute_destination(
@@ -132,10 +345,107 @@ def compute_destination(
     prop = item.get("proposed_name")
     if isinstance(prop, str) and prop:
         rel_dest = Path(prop)
-    dst = (cfg.paths.outgoing_root / media_type / tier.folder / rel_dest).resolve()
+    # Lexical like as_path (os.path.abspath, not resolve()): ".." collapses
+    # without stat()ing every component of every destination.
+    dst = Path(
+        os.path.abspath(
+            os.path.join(cfg.paths.outgoing_root, media_type, tier.folder, rel_dest)
+        )
+    )
     return media_type, tier.id, dst, facts
 
 
+def _detail(base: Dict[str, Any], **outcome: Any) -> Dict[str, Any]:
+    """A routed item's detail: base's path fields, the outcome fields, then
+    base's routing fields (the key order reports have always used)."""
+    d = {k: base[k] for k in ("relpath", "src", "dst", "proposed_name")}
+    d.update(outcome)
+    d.update(
+        media_type=base["media_type"], tier_id=base["tier_id"], facts=base["facts"]
+    )
+    return d
+
+
+def _write_one(
+    cfg: SiftConfig,
+    src: Path,
+    dst: Path,
+    base: Dict[str, Any],
+    dry_run: bool,
+) -> Tuple[str, Dict[str, Any]]:
+    """Copy/move one routed item to dst; returns (counter, detail).
+
+    counter is "copied", "moved", "skipped" or "failed" (or "" for a dry
+    run); base holds the detail fields shared by every outcome. May run on
+    a worker thread, so the caller records written files in its dir_index.
+    """
+    try:
+        # One stat() answers "does the source exist" and feeds the copy.
+        try:
+            src_stat = src.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return "skipped", _detail(base, action="skip", reason="source_missing")
+
+        # If a file with the same destination path already exists, skip
+        if dst.exists():
+            if _same_file(src, dst):
+                return "skipped", _detail(
+                    base, action="skip", reason="already_present_samefile"
+                )
+
+            # Existing destination means this logical file was already
+            # processed; skip instead of writing another deduped copy.
+            return "skipped", _detail(base, action="skip", reason="already_processed")
+
+        _ensure_parent(dst, mkdirs=cfg.io.mkdirs)
+
+        if dry_run:
+            # Print a short progress message so users can see we are working
+            print(f"[sift] transfer: would {cfg.io.mode} {src} -> {dst}", flush=True)
+            return "", _detail(base, action=f"{cfg.io.mode}_dry_run")
+
+        if cfg.io.mode == "copy":
+            # Start copy with progress reporting
+            print(f"[sift] transfer: copying {src} -> {dst}", flush=True)
+            _copy_with_progress(
+                src,
+                dst,
+                src_stat=src_stat,
+                preserve_metadata=cfg.io.preserve_metadata,
+            )
+            return "copied", _detail(base, action="copied")
+
+        if cfg.io.mode == "move":
+            # Attempt fast rename first; if cross-device, fallback to copy+remove with progress
+            print(f"[sift] transfer: moving {src} -> {dst}", flush=True)
+            try:
+                os.rename(src, dst)
+            except OSError:
+                # cross-device; copy with progress then remove src
+                _copy_with_progress(
+                    src,
+                    dst,
+                    src_stat=src_stat,
+                    preserve_metadata=cfg.io.preserve_metadata,
+                )
+                os.remove(src)
+            return "moved", _detail(base, action="moved")
+
+        return "failed", {
+            "relpath": base["relpath"],
+            "src": base["src"],
+            "dst": base["dst"],
+            "proposed_name": base["proposed_name"],
+            "action": "fail",
+            "reason": f"unknown_mode: {cfg.io.mode}",
+        }
+
+    except Exception as e:
+        return "failed", _detail(
+            base, action="fail", reason=f"exception: {type(e).__name__}: {e}"
+        )
+
+
 def transfer_inventory(
     cfg: SiftConfig,
     inventory: Dict[str, Any],
@@ -143,241 +453,150 @@ def transfer_inventory(
     dry_run: bool,
     only_ok_ffprobe: bool = False,
 ) -> TransferResult:
+    # A list, or a single-pass iterator from build_inventory(lazy_items=True).
     items = inventory.get("items")
-    if not isinstance(items, list):
+    if items is None or isinstance(items, (str, bytes, dict)):
         raise ValueError("inventory missing items[] list")
 
-    copied = moved = skipped = failed = 0
-    details: List[Dict[str, Any]] = []
-
-    for item in items:
-        if not isinstance(item, dict):
-            continue
-
-        src_s = item.get("path")
-        rel = item.get("relpath")
-        if not isinstance(src_s, str) or not src_s:
-            continue
+    counts = {"copied": 0, "moved": 0, "skipped": 0, "failed": 0, "": 0}
+    # One entry per reported item, in item order: a (counter, detail) pair, or
+    # a Future of one for copies running on the pool.
+    results: List[Any] = []
+    # Destination directory listings for _find_existing_variant, kept up to
+    # date as this run writes files.
+    dir_index: Dict[Path, Dict[str, str]] = {}
+
+    # Copies may run io.transfer_parallelism at a time. Moves and dry runs
+    # stay sequential (renames within one parent, and readable output).
+    pool = None
+    workers = cfg.io.transfer_parallelism
+    if workers > 1 and cfg.io.mode == "copy" and not dry_run:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    # (parent, name) -> every in-flight copy (future, dst) that may make
+    # `name` (or a dedup variant answering for it) exist there. A later item
+    # checking that name waits for all of them and records what they wrote,
+    # so outcomes match a sequential run. dir_index is only ever touched on
+    # this thread.
+    pending: Dict[Tuple[Path, str], List[Tuple[Future[Any], Path]]] = {}
 
-        src = Path(src_s)
-
-        # Skip items marked as samples (too short, no video, or shorter variants)
-        skip_reason = item.get("skip_reason")
-        if skip_reason:
-            skipped += 1
-            details.append(
-                {
-                    "relpath": rel,
-                    "src": str(src),
-                    "action": "skip",
-                    "reason": skip_reason,
-                }
-            )
-            continue
-
-        if only_ok_ffprobe:
-            ff = item.get("ffprobe")
-            if not isinstance(ff, dict) or ff.get("ok") is not True:
-                skipped += 1
-                details.append(
-                    {
-                        "relpath": rel,
-                        "src": str(src),
-                        "action": "skip",
-                        "reason": "ffprobe_not_ok",
-                    }
-                )
+    try:
+        for item in items:
+            if not isinstance(item, dict):
                 continue
 
-        try:
-            media_type, tier_id, dst, facts = compute_destination(cfg, item)
-        except Exception as e:
-            failed += 1
-            details.append(
-                {
-                    "relpath": rel,
-                    "src": str(src),
-                    "action": "fail",
-                    "reason": f"destination_error: {e}",
-                }
-            )
-            continue
-
-        # proposed_name is the basename we will write to in the destination
-        proposed_name = dst.name
-
-        # Check early for the computed destination or any deduped variant
-        # already present in the destination parent directory. If found, skip
-        # to avoid writing additional copies of the same logical file.
-        existing_variant = _find_existing_variant(dst)
-        if existing_variant:
-            skipped += 1
-            details.append(
-                {
-                    "relpath": rel,
-                    "src": str(src),
-                    "dst": str(dst),
-                    "proposed_name": proposed_name,
-                    "action": "skip",
-                    "reason": "already_processed",
-                    "existing_path": str(existing_variant),
-                    "media_type": media_type,
-                    "tier_id": tier_id,
-                    "facts": facts,
-                }
-            )
-            continue
-
-        try:
-            if not src.exists():
-                skipped += 1
-                details.append(
-                    {
-                        "relpath": rel,
-                        "src": str(src),
-                        "dst": str(dst),
-                        "proposed_name": proposed_name,
-                        "action": "skip",
-                        "reason": "source_missing",
-                        "media_type": media_type,
-                        "tier_id": tier_id,
-                        "facts": facts,
-                    }
-                )
+            src_s = item.get("path")
+            rel = item.get("relpath")
+            if not isinstance(src_s, str) or not src_s:
                 continue
 
-            # If a file with the same destination path already exists, skip
-            if dst.exists():
-                if _same_file(src, dst):
-                    skipped += 1
-                    details.append(
+            src = Path(src_s)
+
+            # Skip items marked as samples (too short, no video, or shorter variants)
+            skip_reason = item.get("skip_reason")
+            if skip_reason:
+                results.append(
+                    (
+                        "skipped",
                         {
                             "relpath": rel,
                             "src": str(src),
-                            "dst": str(dst),
-                            "proposed_name": proposed_name,
                             "action": "skip",
-                            "reason": "already_present_samefile",
-                            "media_type": media_type,
-                            "tier_id": tier_id,
-                            "facts": facts,
-                        }
+                            "reason": skip_reason,
+                        },
                     )
-                    continue
-
-                # Existing destination means this logical file was already
-                # processed; skip instead of writing another deduped copy.
-                skipped += 1
-                details.append(
-                    {
-                        "relpath": rel,
-                        "src": str(src),
-                        "dst": str(dst),
-                        "proposed_name": proposed_name,
-                        "action": "skip",
-                        "reason": "already_processed",
-                        "media_type": media_type,
-                        "tier_id": tier_id,
-                        "facts": facts,
-                    }
                 )
                 continue
 
-            _ensure_parent(dst, mkdirs=cfg.io.mkdirs)
+            if only_ok_ffprobe:
+                ff = item.get("ffprobe")
+                if not isinstance(ff, dict) or ff.get("ok") is not True:
+                    results.append(
+                        (
+                            "skipped",
+                            {
+                                "relpath": rel,
+                                "src": str(src),
+                                "action": "skip",
+                                "reason": "ffprobe_not_ok",
+                            },
+                        )
+                    )
+                    continue
 
-            if dry_run:
-                # Print a short progress message so users can see we are working
-                print(
-                    f"[sift] transfer: would {cfg.io.mode} {src} -> {dst}", flush=True
-                )
-                details.append(
-                    {
-                        "relpath": rel,
-                        "src": str(src),
-                        "dst": str(dst),
-                        "proposed_name": proposed_name,
-                        "action": f"{cfg.io.mode}_dry_run",
-                        "media_type": media_type,
-                        "tier_id": tier_id,
-                        "facts": facts,
-                    }
+            try:
+                media_type, tier_id, dst, facts = compute_destination(cfg, item)
+            except Exception as e:
+                results.append(
+                    (
+                        "failed",
+                        {
+                            "relpath": rel,
+                            "src": str(src),
+                            "action": "fail",
+                            "reason": f"destination_error: {e}",
+                        },
+                    )
                 )
                 continue
 
-            if cfg.io.mode == "copy":
-                # Start copy with progress reporting
-                print(f"[sift] transfer: copying {src} -> {dst}", flush=True)
-                _copy_with_progress(src, dst)
-                copied += 1
-                details.append(
-                    {
-                        "relpath": rel,
-                        "src": str(src),
-                        "dst": str(dst),
-                        "proposed_name": proposed_name,
-                        "action": "copied",
-                        "media_type": media_type,
-                        "tier_id": tier_id,
-                        "facts": facts,
-                    }
-                )
-            elif cfg.io.mode == "move":
-                # Attempt fast rename first; if cross-device, fallback to copy+remove with progress
-                print(f"[sift] transfer: moving {src} -> {dst}", flush=True)
-                try:
-                    os.rename(src, dst)
-                    moved += 1
-                except OSError:
-                    # cross-device; copy with progress then remove src
-                    _copy_with_progress(src, dst)
-                    try:
-                        os.remove(src)
-                    except OSError:
-                        # non-fatal: leave file and record failure
-                        raise
-                    moved += 1
-
-                details.append(
-                    {
-                        "relpath": rel,
-                        "src": str(src),
-                        "dst": str(dst),
-                        "proposed_name": proposed_name,
-                        "action": "moved",
-                        "media_type": media_type,
-                        "tier_id": tier_id,
-                        "facts": facts,
-                    }
-                )
-            else:
-                failed += 1
-                details.append(
-                    {
-                        "relpath": rel,
-                        "src": str(src),
-                        "dst": str(dst),
-                        "proposed_name": proposed_name,
-                        "action": "fail",
-                        "reason": f"unknown_mode: {cfg.io.mode}",
-                    }
+            # proposed_name is the basename we will write to in the destination
+            base = {
+                "relpath": rel,
+                "src": str(src),
+                "dst": str(dst),
+                "proposed_name": dst.name,
+                "media_type": media_type,
+                "tier_id": tier_id,
+                "facts": facts,
+            }
+
+            for fut, written in pending.pop((dst.parent, dst.name), ()):
+                if fut.result()[0] == "copied":
+                    _record_written(dir_index, written)
+
+            # Check early for the computed destination or any deduped variant
+            # already present in the destination parent directory. If found, skip
+            # to avoid writing additional copies of the same logical file.
+            existing_variant = _find_existing_variant(dst, dir_index)
+            if existing_variant:
+                results.append(
+                    (
+                        "skipped",
+                        _detail(
+                            base,
+                            action="skip",
+                            reason="already_processed",
+                            existing_path=str(existing_variant),
+                        ),
+                    )
                 )
+                continue
 
-        except Exception as e:
-            failed += 1
-            details.append(
-                {
-                    "relpath": rel,
-                    "src": str(src),
-                    "dst": str(dst),
-                    "proposed_name": proposed_name,
-                    "action": "fail",
-                    "reason": f"exception: {type(e).__name__}: {e}",
-                    "media_type": media_type,
-                    "tier_id": tier_id,
-                    "facts": facts,
-                }
-            )
+            if pool is None:
+                result = _write_one(cfg, src, dst, base, dry_run)
+                if result[0] in ("copied", "moved"):
+                    _record_written(dir_index, dst)
+                results.append(result)
+                continue
+
+            fut = pool.submit(_write_one, cfg, src, dst, base, dry_run)
+            for name in _index_keys(dst.name):
+                pending.setdefault((dst.parent, name), []).append((fut, dst))
+            results.append(fut)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    details: List[Dict[str, Any]] = []
+    for r in results:
+        counter, detail = r.result() if isinstance(r, Future) else r
+        counts[counter] += 1
+        details.append(detail)
 
     return TransferResult(
-        copied=copied, moved=moved, skipped=skipped, failed=failed, details=details
+        copied=counts["copied"],
+        moved=counts["moved"],
+        skipped=counts["skipped"],
+        failed=counts["failed"],
+        details=details,
     )
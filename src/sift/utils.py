@@ -1,33 +1,148 @@
 from __future__ import annotations
 
+import json
 import os
+import re
+import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson  # optional: native JSON encode/decode
+except ModuleNotFoundError:  # pragma: no cover - depends on environment
+    orjson = None
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to indented, key-sorted UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(obj, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def json_dumps_line(obj: Any) -> bytes:
+    """Serialize to one compact, key-sorted UTF-8 JSON line (JSON Lines)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, sort_keys=True, separators=(",", ":")) + "\n").encode(
+        "utf-8"
+    )
+
+
+def json_loads(raw: bytes | str) -> Any:
+    """Parse JSON from bytes or str; raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _interned_keys(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    return {sys.intern(k): v for k, v in pairs}
+
+
+_RECORD_DECODER = json.JSONDecoder(object_pairs_hook=_interned_keys)
+
+
+def json_loads_record(raw: bytes | str) -> Any:
+    """json_loads for one of many same-shaped records (a JSON Lines item).
+
+    The stdlib parser only shares key strings within a single document, so
+    every line would carry its own copies of "relpath", "ffprobe", "codec",
+    ...; interning them keeps a large inventory's dicts pointing at one
+    copy. orjson already caches short keys.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    return _RECORD_DECODER.decode(raw)
+
+
 def as_path(s: str) -> Path:
+    """Expand ~ and $VARS and make the path absolute.
+
+    Normalization is lexical (os.path.abspath): symlinks are not resolved,
+    so no realpath walk touches the filesystem (slow on NFS/SMB mounts).
+    """
     expanded = os.path.expandvars(os.path.expanduser(s))
-    return Path(expanded).resolve()
+    return Path(os.path.abspath(expanded))
+
+
+def split_name(rel: str) -> Tuple[str, str]:
+    """(stem, suffix) of a path's final component, as Path.stem/Path.suffix.
+
+    String-only, so per-file code avoids building a Path just to read these.
+    """
+    name = os.path.basename(rel)
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[:dot], name[dot:]
+    return name, ""
+
+
+# ffprobe reports many numbers as strings and uses "N/A" for missing ones;
+# inspecting the string first keeps that common case off the exception path.
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+# ffprobe repeats the same few numeric strings ("0", "48000", "1920",
+# "24000/1001", ...) across streams and files, so string parses are memoized.
+# Only str inputs reach the caches: they are hashable and None never is cached.
+@lru_cache(maxsize=4096)
+def _int_from_str(v: str) -> Optional[int]:
+    digits = v[1:] if v[:1] in ("-", "+") else v
+    return int(v) if digits.isdecimal() else None
+
+
+@lru_cache(maxsize=4096)
+def _float_from_str(v: str) -> Optional[float]:
+    return float(v) if _FLOAT_RE.fullmatch(v) else None
+
+
+@lru_cache(maxsize=1024)
+def _ratio_from_str(v: str) -> Optional[float]:
+    num_s, sep, den_s = v.partition("/")
+    if not sep:
+        return _float_from_str(v)
+    num = _float_from_str(num_s)
+    den = _float_from_str(den_s)
+    if not num or not den:
+        return None
+    return num / den
 
 
 def safe_int(v: Any) -> Optional[int]:
+    if v is None:
+        return None
+    if type(v) is int:
+        return v
+    if type(v) is str:
+        return _int_from_str(v)
     try:
-        if v is None:
-            return None
         return int(v)
-    except (TypeError, ValueError):
+    except (TypeError, ValueError, OverflowError):
         return None
 
 
 def safe_float(v: Any) -> Optional[float]:
+    if v is None:
+        return None
+    if type(v) is str:
+        return _float_from_str(v)
     try:
-        if v is None:
-            return None
         return float(v)
     except (TypeError, ValueError):
         return None
@@ -35,11 +150,6 @@ def safe_float(v: Any) -> Optional[float]:
 
 def parse_ratio(v: Any) -> Optional[float]:
     # ffprobe often reports "24000/1001"
-    if isinstance(v, str) and "/" in v:
-        num_s, den_s = v.split("/", 1)
-        num = safe_float(num_s)
-        den = safe_float(den_s)
-        if not num or not den or den == 0:
-            return None
-        return num / den
+    if type(v) is str:
+        return _ratio_from_str(v)
     return safe_float(v)
@@ -2,7 +2,9 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from sift.cache import read_cache, write_cache
+import sift.utils as utils
+from sift.cache import cache_path, iter_cache_items, read_cache, write_cache
+from sift.errors import CacheError
 from sift.model import (
     PathsConfig,
     IOConfig,
@@ -12,6 +14,7 @@ from sift.model import (
     TierModelConfig,
     FlagsConfig,
     ReportingConfig,
+    SampleDetectionConfig,
     SiftConfig,
     TierDef,
 )
@@ -75,6 +78,12 @@ def dummy_cfg(cache_dir: Path) -> SiftConfig:
         reporting=ReportingConfig(
             write_jsonl_report=False, report_path=cache_dir / "report.jsonl"
         ),
+        sample_detection=SampleDetectionConfig(
+            enabled=False,
+            min_duration_s=0.0,
+            prefer_longest_variant=False,
+            min_video_streams=0,
+        ),
     )
 
 
@@ -95,3 +104,41 @@ class TestCache(unittest.TestCase):
             data = read_cache(cfg)
             self.assertEqual(data["count"], 1)
             self.assertEqual(data["items"][0]["relpath"], "a.mkv")
+
+    def test_jsonl_layout_and_streaming_reader(self):
+        with tempfile.TemporaryDirectory() as td:
+            cfg = dummy_cfg(Path(td))
+            items = [
+                {"relpath": f"{n}.mkv", "ffprobe": {"ok": True, "note": "a\nb"}}
+                for n in ("a", "b", "c")
+            ]
+            written = write_cache(cfg, items=items, errors=1)
+            cp = cache_path(cfg)
+
+            lines = cp.read_bytes().splitlines()
+            self.assertEqual(len(lines), 4)  # header + one line per item
+            data = read_cache(cfg)
+            self.assertEqual(data["errors"], 1)
+            self.assertEqual(data["items"], items)
+            self.assertEqual(written, data)
+            self.assertEqual(list(iter_cache_items(cfg)), items)
+
+            # Items parsed from separate lines share their key strings (the
+            # stdlib path interns them; orjson's key cache is best-effort).
+            if utils.orjson is None:
+                first, second = (list(it["ffprobe"]) for it in data["items"][:2])
+                for k1, k2 in zip(first, second):
+                    self.assertIs(k1, k2)
+
+    def test_truncated_cache_is_rejected(self):
+        with tempfile.TemporaryDirectory() as td:
+            cfg = dummy_cfg(Path(td))
+            write_cache(
+                cfg, items=[{"relpath": "a.mkv"}, {"relpath": "b.mkv"}], errors=0
+            )
+            cp = cache_path(cfg)
+            cp.write_bytes(b"".join(cp.read_bytes().splitlines(True)[:2]))
+            with self.assertRaises(CacheError):
+                read_cache(cfg)
+            with self.assertRaises(CacheError):
+                list(iter_cache_items(cfg))
@@ -1,6 +1,17 @@
 from pathlib import Path
 
+import pytest
+
+import sift.cache as cache_mod
+import sift.cli as cli_mod
 from sift.cli import main
+from sift.config import load_config
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_cache(tmp_path, monkeypatch):
+    # main() pickles parsed configs under $XDG_CACHE_HOME/sift; keep that in tmp.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
 
 
 def _cfg_text_with_paths(tmp_path: Path) -> str:
@@ -59,3 +70,46 @@ def test_effective_dry_run_prints_banner(tmp_path, capsys):
     captured = capsys.readouterr()
     assert "DRY RUN (no filesystem changes)" in captured.out
     assert isinstance(exit_code, int)
+
+
+def test_print_folders_skips_argparse(tmp_path, capsys, monkeypatch):
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text(_cfg_text_with_paths(tmp_path))
+
+    def no_argparse():
+        raise AssertionError("argparse parser was built")
+
+    monkeypatch.setattr(cli_mod, "build_arg_parser", no_argparse)
+    assert main([f"--config={cfg_file}", "--print-folders"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert str(tmp_path / "cache") in out
+
+
+def test_apply_rejects_truncated_cache_before_moving(tmp_path, capsys):
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text(
+        _cfg_text_with_paths(tmp_path).replace('mode = "copy"', 'mode = "move"')
+    )
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    cfg = load_config(cfg_file)
+    items = []
+    for name in ["a.mkv", "b.mkv", "c.mkv"]:
+        (incoming / name).write_bytes(b"x")
+        items.append(
+            {
+                "relpath": name,
+                "path": str(incoming / name),
+                "size": 1,
+                "ffprobe": {"ok": True},
+                "proposed_name": name,
+            }
+        )
+    cache_mod.write_cache(cfg, items=items, errors=0)
+    cp = cache_mod.cache_path(cfg)
+    lines = cp.read_bytes().splitlines(keepends=True)
+    cp.write_bytes(b"".join(lines[:-1]))
+
+    assert main(["--config", str(cfg_file), "--apply"]) == 3
+    assert "truncated" in capsys.readouterr().err
+    assert sorted(p.name for p in incoming.iterdir()) == ["a.mkv", "b.mkv", "c.mkv"]
@@ -0,0 +1,122 @@
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+import sift.config_cache as config_cache
+from sift.errors import ConfigError
+
+
+def _write_config(tmp_path: Path, incoming: str) -> Path:
+    base = Path(__file__).resolve().parents[1]
+    text = (base / "config.example.toml").read_text(encoding="utf-8")
+    text = text.replace('incoming = "/nas/plex/incoming"', f'incoming = "{incoming}"')
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text(text, encoding="utf-8")
+    return cfg_file
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    home = tmp_path / "xdg"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home))
+    return home / "sift"
+
+
+def test_second_load_uses_pickled_config(tmp_path, cache_home, monkeypatch):
+    cfg_file = _write_config(tmp_path, str(tmp_path / "in"))
+
+    first = config_cache.load_or_parse(cfg_file)
+    assert len(list(cache_home.glob("config-*.pkl"))) == 1
+
+    def no_parse(path):
+        raise AssertionError("config was re-parsed")
+
+    monkeypatch.setattr(config_cache, "load_config", no_parse)
+    second = config_cache.load_or_parse(cfg_file)
+    assert second == first
+    assert second.classification.tv_sxe_re.search("Show.S01E02.mkv")
+
+
+def test_changed_config_is_reparsed(tmp_path, cache_home):
+    cfg_file = _write_config(tmp_path, str(tmp_path / "in"))
+    config_cache.load_or_parse(cfg_file)
+
+    cfg_file.write_text(
+        cfg_file.read_text().replace(str(tmp_path / "in"), str(tmp_path / "other"))
+    )
+    st = cfg_file.stat()
+    os.utime(cfg_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert config_cache.load_or_parse(cfg_file).paths.incoming == tmp_path / "other"
+
+
+def test_env_dependent_config_is_not_cached(tmp_path, cache_home, monkeypatch):
+    monkeypatch.setenv("SIFT_TEST_IN", str(tmp_path / "in"))
+    cfg_file = _write_config(tmp_path, "$SIFT_TEST_IN")
+
+    cfg = config_cache.load_or_parse(cfg_file)
+    assert cfg.paths.incoming == tmp_path / "in"
+    assert not cache_home.exists()
+
+
+def test_dollar_outside_paths_is_still_cached(tmp_path, cache_home):
+    cfg_file = _write_config(tmp_path, str(tmp_path / "in"))
+    text = cfg_file.read_text(encoding="utf-8")
+    cfg_file.write_text(
+        text.replace(
+            'mode = "copy"', 'mode = "copy"\n# $HOME is not a path here', 1
+        ).replace("[naming]", '[naming]\nhdr_sep_note = "^$"', 1),
+        encoding="utf-8",
+    )
+
+    config_cache.load_or_parse(cfg_file)
+    assert len(list(cache_home.glob("config-*.pkl"))) == 1
+
+
+def test_machine_dependent_defaults_are_part_of_the_key(
+    tmp_path, cache_home, monkeypatch
+):
+    cfg_file = _write_config(tmp_path, str(tmp_path / "in"))
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    assert config_cache.load_or_parse(cfg_file).ffprobe.jobs == 2
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    assert config_cache.load_or_parse(cfg_file).ffprobe.jobs == 4
+
+
+def test_blake3_config_is_rechecked_when_the_package_goes_away(
+    tmp_path, cache_home, monkeypatch
+):
+    cfg_file = _write_config(tmp_path, str(tmp_path / "in"))
+    cfg_file.write_text(
+        cfg_file.read_text().replace('fingerprint = "off"', 'fingerprint = "blake3"')
+    )
+    real_find_spec = importlib.util.find_spec
+
+    def find_spec(name, *args):
+        if name == "blake3":
+            return object() if installed else None
+        return real_find_spec(name, *args)
+
+    monkeypatch.setattr(importlib.util, "find_spec", find_spec)
+    installed = True
+    assert config_cache.load_or_parse(cfg_file).cache.fingerprint == "blake3"
+
+    installed = False
+    with pytest.raises(ConfigError, match="requires the blake3 package"):
+        config_cache.load_or_parse(cfg_file)
+
+
+def test_missing_config_is_a_config_error(tmp_path, cache_home):
+    with pytest.raises(ConfigError, match="Config file not found"):
+        config_cache.load_or_parse(tmp_path / "nope.toml")
+
+
+def test_env_var_disables_cache(tmp_path, cache_home, monkeypatch):
+    monkeypatch.setenv("SIFT_CONFIG_CACHE", "0")
+    cfg_file = _write_config(tmp_path, str(tmp_path / "in"))
+
+    assert config_cache.load_or_parse(cfg_file).paths.incoming == tmp_path / "in"
+    assert not cache_home.exists()
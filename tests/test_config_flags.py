@@ -1,6 +1,16 @@
+import os
 import tomllib
+from pathlib import Path
 
-from sift.config import parse_config
+import pytest
+
+from sift.config import load_config, load_toml, parse_config
+from sift.errors import ConfigError
+
+
+def _example_root() -> dict:
+    ex = Path(__file__).resolve().parents[1] / "config.example.toml"
+    return tomllib.loads(ex.read_text(encoding="utf-8"))
 
 
 def test_judgement_flags_parsed(tmp_path):
@@ -79,3 +89,148 @@ report_path = "./report.jsonl"
     root = tomllib.loads(cfg_text)
     cfg = parse_config(root)
     assert cfg.flags.judgement_flags == ["FOO", "BAR"]
+
+
+def test_load_toml_reuses_parse_until_file_changes(tmp_path):
+    p = tmp_path / "config.toml"
+    p.write_text('[io]\nmode = "copy"\n')
+
+    first = load_toml(p)
+    first["io"]["mode"] = "mutated"
+    again = load_toml(p)
+    assert again == {"io": {"mode": "copy"}}
+    assert again is not first
+
+    p.write_text('[io]\nmode = "move"\n')
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_toml(p)["io"]["mode"] == "move"
+
+
+def test_load_config_memoizes_until_file_changes(tmp_path):
+    ex = Path(__file__).resolve().parents[1] / "config.example.toml"
+    p = tmp_path / "config.toml"
+    p.write_bytes(ex.read_bytes())
+
+    first = load_config(p)
+    assert load_config(p) is first
+
+    p.write_text(p.read_text().replace('mode = "copy"', 'mode = "move"', 1))
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = load_config(p)
+    assert second is not first
+    assert second.io.mode == "move"
+
+
+def test_load_config_memo_ignores_dollar_outside_paths(tmp_path, monkeypatch):
+    ex = Path(__file__).resolve().parents[1] / "config.example.toml"
+    text = ex.read_text(encoding="utf-8")
+    anchored = text.replace(
+        'episode\\\\s*\\\\d{1,3}\\\\b"', 'episode\\\\s*\\\\d{1,3}\\\\b.*$"'
+    )
+    assert anchored != text
+    p = tmp_path / "config.toml"
+    p.write_text(anchored, encoding="utf-8")
+    assert load_config(p) is load_config(p)
+
+    monkeypatch.setenv("SIFT_TEST_IN", str(tmp_path / "in"))
+    env = tmp_path / "env.toml"
+    env.write_text(
+        text.replace('incoming = "/nas/plex/incoming"', 'incoming = "$SIFT_TEST_IN"'),
+        encoding="utf-8",
+    )
+    assert load_config(env) is not load_config(env)
+
+
+def test_classification_regexes_compiled_once():
+    root = _example_root()
+    root["classification"]["hdr_side_data_regex"] = ["dovi", "hdr10"]
+    cls = parse_config(root).classification
+
+    assert cls.tv_sxe_re.search("Show.S01E02.mkv")
+    assert [p.pattern for p in cls.hdr_side_data_res] == ["dovi", "hdr10"]
+    assert cls.hdr_side_data_regex == ["dovi", "hdr10"]
+
+
+def test_invalid_list_regex_is_a_config_error():
+    root = _example_root()
+    root["classification"]["hdr_side_data_regex"] = ["dovi", "(unclosed"]
+    with pytest.raises(ConfigError, match="invalid regex '\\(unclosed'"):
+        parse_config(root)
+
+
+def test_invalid_tv_regex_is_a_config_error():
+    root = _example_root()
+    root["classification"]["tv_sxe_regex"] = "(unclosed"
+    with pytest.raises(ConfigError, match="invalid regex"):
+        parse_config(root)
+
+
+def test_cache_fingerprint_algorithms():
+    root = _example_root()
+    root["cache"]["fingerprint"] = "BLAKE2B"
+    assert parse_config(root).cache.fingerprint == "blake2b"
+
+    root["cache"]["fingerprint"] = "md5"
+    with pytest.raises(ConfigError, match="cache.fingerprint"):
+        parse_config(root)
+
+    root["cache"]["fingerprint"] = "blake3"
+    try:
+        import blake3  # noqa: F401
+    except ModuleNotFoundError:
+        with pytest.raises(ConfigError, match="requires the blake3 package"):
+            parse_config(root)
+    else:
+        assert parse_config(root).cache.fingerprint == "blake3"
+
+
+def test_expect_validates_values():
+    root = _example_root()
+    del root["paths"]["incoming"]
+    with pytest.raises(ConfigError, match="Missing required config value"):
+        parse_config(root)
+
+    root = _example_root()
+    root["naming"]["hdr_sep"] = ""
+    with pytest.raises(ConfigError, match="non-empty str for 'naming.hdr_sep'"):
+        parse_config(root)
+
+    root = _example_root()
+    root["ffprobe"]["args"] = ["-v", 1]
+    with pytest.raises(ConfigError, match="list of str for 'ffprobe.args'"):
+        parse_config(root)
+
+    root = _example_root()
+    root["flags"]["hfr_fps_threshold"] = 30
+    assert parse_config(root).flags.hfr_fps_threshold == 30.0
+
+
+def test_typed_tables_are_copied_or_converted():
+    root = _example_root()
+    cfg = parse_config(root)
+    assert cfg.naming.vcodec_map == root["naming"]["vcodec_map"]
+    root["naming"]["vcodec_map"]["zzz"] = "ZZZ"
+    assert "zzz" not in cfg.naming.vcodec_map
+
+    resolution = root["classification"].setdefault("resolution", {})
+    resolution["vertical_thresholds"] = {"1080p": "1000"}
+    assert parse_config(root).classification.vertical_thresholds == {"1080p": 1000}
+
+    resolution["vertical_thresholds"] = {"1080p": "high"}
+    with pytest.raises(ConfigError, match="vertical_thresholds"):
+        parse_config(root)
+
+
+def test_sxe_parse_pattern_shared_with_classification():
+    root = _example_root()
+    cls = parse_config(root).classification
+    assert cls.sxe_parse_re is cls.tv_sxe_re
+
+    # A pattern without season/episode groups still classifies; names are
+    # parsed with the built-in pattern.
+    root["classification"]["tv_sxe_regex"] = r"(?i)\bs\d+e\d+\b"
+    cls = parse_config(root).classification
+    assert cls.sxe_parse_re is not cls.tv_sxe_re
+    assert cls.sxe_parse_re.search("Show.S01E02").group("episode") == "02"
@@ -1,5 +1,12 @@
+import os
+import sys
+import tempfile
 import unittest
-from sift.ffprobe import summarize
+from pathlib import Path
+
+from sift.ffprobe import run_ffprobe, summarize
+from sift.model import FFProbeConfig
+from sift.utils import parse_ratio, safe_float, safe_int
 
 
 class TestSummarize(unittest.TestCase):
@@ -35,3 +42,89 @@ class TestSummarize(unittest.TestCase):
         self.assertEqual(s["video"]["codec"], "hevc")
         self.assertEqual(s["audio"]["codec"], "eac3")
         self.assertEqual(s["audio"]["channels"], 6)
+
+    def test_summarize_picks_best_streams_first_wins_ties(self):
+        ff = {
+            "streams": [
+                {
+                    "codec_type": "video",
+                    "codec_name": "h264",
+                    "width": 1280,
+                    "height": 720,
+                },
+                {
+                    "codec_type": "video",
+                    "codec_name": "hevc",
+                    "width": 1920,
+                    "height": 1080,
+                },
+                {
+                    "codec_type": "video",
+                    "codec_name": "av1",
+                    "width": 1920,
+                    "height": 1080,
+                },
+                {"codec_type": "audio", "codec_name": "aac", "channels": 2},
+                {
+                    "codec_type": "audio",
+                    "codec_name": "ac3",
+                    "channels": 6,
+                    "bit_rate": "448000",
+                },
+                {
+                    "codec_type": "audio",
+                    "codec_name": "eac3",
+                    "channels": 6,
+                    "bit_rate": "640000",
+                },
+                {"codec_type": "subtitle", "codec_name": "subrip"},
+            ]
+        }
+        s = summarize(ff)
+        self.assertEqual(s["video"]["codec"], "hevc")
+        self.assertEqual(s["audio"]["codec"], "eac3")
+        self.assertEqual(s["stream_counts"], {"video": 3, "audio": 3})
+
+    def test_run_ffprobe_reports_missing_binary(self):
+        cfg = FFProbeConfig(bin="sift-no-such-ffprobe", args=[])
+        ff, err = run_ffprobe(cfg, Path("movie.mkv"))
+        self.assertIsNone(ff)
+        self.assertEqual(err, "ffprobe not found: sift-no-such-ffprobe")
+
+    @unittest.skipIf(sys.platform == "win32", "uses a POSIX shell script")
+    def test_run_ffprobe_parses_stdout_and_reports_stderr(self):
+        with tempfile.TemporaryDirectory() as td:
+            fake = Path(td) / "fake-ffprobe"
+            fake.write_text(
+                "#!/bin/sh\n"
+                'case "$1" in\n'
+                "  *bad*) echo 'bad input: caf\u00e9' >&2; exit 1 ;;\n"
+                '  *) echo \'{"format": {"duration": "1.5"}}\' ;;\n'
+                "esac\n",
+                encoding="utf-8",
+            )
+            os.chmod(fake, 0o755)
+            cfg = FFProbeConfig(bin=str(fake), args=[])
+
+            ff, err = run_ffprobe(cfg, Path("good.mkv"))
+            self.assertIsNone(err)
+            self.assertEqual(ff, {"format": {"duration": "1.5"}})
+
+            ff, err = run_ffprobe(cfg, Path("bad.mkv"))
+            self.assertIsNone(ff)
+            self.assertEqual(err, "bad input: caf\u00e9")
+
+    def test_numeric_parsers_handle_ffprobe_strings(self):
+        self.assertEqual(safe_int("1920"), 1920)
+        self.assertEqual(safe_int("-3"), -3)
+        self.assertEqual(safe_int(6), 6)
+        self.assertIsNone(safe_int("N/A"))
+        self.assertIsNone(safe_int("1.5"))
+        self.assertIsNone(safe_int(None))
+        self.assertEqual(safe_float("12.500000"), 12.5)
+        self.assertEqual(safe_float("1e3"), 1000.0)
+        self.assertIsNone(safe_float("N/A"))
+        self.assertAlmostEqual(parse_ratio("24000/1001"), 23.976, places=3)
+        self.assertEqual(parse_ratio("25"), 25.0)
+        self.assertIsNone(parse_ratio("0/0"))
+        self.assertIsNone(parse_ratio("N/A"))
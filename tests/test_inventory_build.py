@@ -0,0 +1,288 @@
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+import sift.cache as cache_mod
+import sift.inventory as inventory_mod
+from sift.errors import ConfigError
+from sift.model import (
+    CacheConfig,
+    PathsConfig,
+    IOConfig,
+    FFProbeConfig,
+    ClassificationConfig,
+    NamingConfig,
+    TierModelConfig,
+    TierDef,
+    FlagsConfig,
+    ReportingConfig,
+    SampleDetectionConfig,
+    SiftConfig,
+)
+
+
+def make_cfg(base: Path, jobs: int) -> SiftConfig:
+    return SiftConfig(
+        paths=PathsConfig(
+            incoming=base / "incoming",
+            outgoing_root=base / "outgoing",
+            metadata_cache=base / "cache",
+        ),
+        io=IOConfig(mode="copy", mkdirs=True, dedupe_on_collision=True),
+        ffprobe=FFProbeConfig(bin="ffprobe", args=[], jobs=jobs),
+        classification=ClassificationConfig(
+            media_type_strategy="folder",
+            tv_sxe_regex="x",
+            enable_season_episode_words=False,
+            tv_season_episode_regex="y",
+            video_stream_strategy="best",
+            audio_stream_strategy="best",
+            audio_codec_preference=[],
+            problem_audio_codecs=[],
+            problem_audio_profile_regex=[],
+            hdr_color_transfer=[],
+            hdr_side_data_regex=[],
+        ),
+        naming=NamingConfig(
+            movie_template="{stem}.{ext}",
+            tv_template="{stem}.{ext}",
+            hdr_sep=" ",
+            flags_sep=" ",
+            fallback_to_stem=True,
+            vcodec_map={},
+            acodec_map={},
+            sanitize=True,
+            max_filename_len=200,
+        ),
+        tier_model=TierModelConfig(
+            tiers=1,
+            tier=[
+                TierDef(id="T1", folder="tier1", description="", requires={}, flags=[])
+            ],
+        ),
+        flags=FlagsConfig(
+            enable_hfr_flag=False,
+            hfr_fps_threshold=60.0,
+            enable_low_bitrate_flag=False,
+            low_bitrate_thresholds={},
+            low_bitrate_flag_name="LOW",
+            judgement_flags=[],
+        ),
+        reporting=ReportingConfig(
+            write_jsonl_report=False, report_path=base / "report.jsonl"
+        ),
+        sample_detection=SampleDetectionConfig(
+            enabled=False,
+            min_duration_s=0.0,
+            prefer_longest_variant=False,
+            min_video_streams=0,
+        ),
+    )
+
+
+def _fake_ffprobe(cfg, media_path):
+    if Path(media_path).name.startswith("bad"):
+        return None, "boom"
+    return {"format": {"duration": "600"}, "streams": []}, None
+
+
+def test_parallel_scan_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr(inventory_mod, "run_ffprobe", _fake_ffprobe)
+
+    incoming = tmp_path / "incoming"
+    (incoming / "sub").mkdir(parents=True)
+    for name in ["c.mkv", "a.mkv", "bad1.mkv", "sub/b.mkv", "bad2.mp4"]:
+        (incoming / name).write_bytes(b"x")
+
+    serial = inventory_mod.build_inventory(make_cfg(tmp_path, jobs=1), rescan=True)
+    parallel = inventory_mod.build_inventory(make_cfg(tmp_path, jobs=4), rescan=True)
+
+    rel = [it["relpath"] for it in parallel["items"]]
+    assert rel == sorted(rel)
+    assert rel == [it["relpath"] for it in serial["items"]]
+    assert parallel["count"] == 5
+    assert parallel["errors"] == serial["errors"] == 2
+
+
+def test_rescan_reuses_unchanged_ffprobe_results(tmp_path, monkeypatch):
+    probed = []
+
+    def counting_ffprobe(cfg, media_path):
+        probed.append(Path(media_path).name)
+        return _fake_ffprobe(cfg, media_path)
+
+    monkeypatch.setattr(inventory_mod, "run_ffprobe", counting_ffprobe)
+
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    for name in ["a.mkv", "b.mkv", "bad.mkv"]:
+        (incoming / name).write_bytes(b"x")
+
+    cfg = make_cfg(tmp_path, jobs=2)
+    inventory_mod.build_inventory(cfg, rescan=True)
+    assert sorted(probed) == ["a.mkv", "b.mkv", "bad.mkv"]
+
+    # Only the changed file and the previous failure are probed again.
+    probed.clear()
+    (incoming / "b.mkv").write_bytes(b"changed")
+    inv = inventory_mod.build_inventory(cfg, rescan=True)
+    assert sorted(probed) == ["b.mkv", "bad.mkv"]
+    named = {it["relpath"]: "proposed_name" in it for it in inv["items"]}
+    assert named == {"a.mkv": True, "b.mkv": True, "bad.mkv": False}
+
+    probed.clear()
+    inventory_mod.build_inventory(cfg, rescan=True, force_ffprobe=True)
+    assert sorted(probed) == ["a.mkv", "b.mkv", "bad.mkv"]
+
+
+def test_fingerprint_reuses_results_after_mtime_change(tmp_path, monkeypatch):
+    probed = []
+
+    def counting_ffprobe(cfg, media_path):
+        probed.append(Path(media_path).name)
+        return _fake_ffprobe(cfg, media_path)
+
+    monkeypatch.setattr(inventory_mod, "run_ffprobe", counting_ffprobe)
+
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    (incoming / "a.mkv").write_bytes(b"a" * 4096)
+    (incoming / "b.mkv").write_bytes(b"b" * 4096)
+
+    cfg = replace(make_cfg(tmp_path, jobs=2), cache=CacheConfig(fingerprint="blake2b"))
+    inv = inventory_mod.build_inventory(cfg, rescan=True)
+    assert all(it["fp"].startswith("blake2b:") for it in inv["items"])
+
+    probed.clear()
+    # Same bytes, new mtime (e.g. copied from another host): still reused.
+    os.utime(incoming / "a.mkv", ns=(1, 1))
+    # Same size, different content: re-probed.
+    (incoming / "b.mkv").write_bytes(b"c" * 4096)
+    inventory_mod.build_inventory(cfg, rescan=True)
+    assert probed == ["b.mkv"]
+
+
+def test_fingerprint_of_the_other_algorithm_is_recomputed(tmp_path, monkeypatch):
+    monkeypatch.setattr(inventory_mod, "run_ffprobe", _fake_ffprobe)
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    (incoming / "a.mkv").write_bytes(b"a" * 4096)
+
+    cfg = replace(make_cfg(tmp_path, jobs=1), cache=CacheConfig(fingerprint="blake2b"))
+    inventory_mod.build_inventory(cfg, rescan=True)
+
+    # Pretend an older run used another algorithm; the unchanged file keeps
+    # its ffprobe summary but gets a fingerprint of the configured kind.
+    data = cache_mod.read_cache(cfg)
+    data["items"][0]["fp"] = "other:0123"
+    cache_mod.write_cache(cfg, items=data["items"], errors=data["errors"])
+
+    inv = inventory_mod.build_inventory(cfg, rescan=True)
+    assert inv["items"][0]["fp"].startswith("blake2b:")
+
+
+def test_blake3_fingerprint_without_the_package_is_a_config_error(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(inventory_mod, "blake3", None)
+    (tmp_path / "incoming").mkdir()
+    (tmp_path / "incoming" / "a.mkv").write_bytes(b"x")
+    cfg = replace(make_cfg(tmp_path, jobs=1), cache=CacheConfig(fingerprint="blake3"))
+
+    with pytest.raises(ConfigError, match="requires the blake3 package"):
+        inventory_mod.build_inventory(cfg, rescan=True)
+    with pytest.raises(ConfigError, match="requires the blake3 package"):
+        inventory_mod._fingerprint(str(tmp_path / "incoming" / "a.mkv"), 1, "blake3")
+
+
+def test_malformed_ffprobe_output_is_a_failed_probe(tmp_path, monkeypatch):
+    def odd_ffprobe(cfg, media_path):
+        return {"streams": ["not-a-stream"]}, None
+
+    monkeypatch.setattr(inventory_mod, "run_ffprobe", odd_ffprobe)
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    (incoming / "a.mkv").write_bytes(b"x")
+
+    inv = inventory_mod.build_inventory(make_cfg(tmp_path, jobs=1), rescan=True)
+
+    assert inv["errors"] == 1
+    ff = inv["items"][0]["ffprobe"]
+    assert ff["ok"] is False
+    assert ff["error"].startswith("unexpected ffprobe output")
+
+
+def test_process_executor_matches_threads(tmp_path):
+    fake = tmp_path / "ffprobe"
+    fake.write_text(
+        "#!/bin/sh\n"
+        'case "$1" in\n'
+        "  *bad*) echo boom >&2; exit 1 ;;\n"
+        '  *) echo \'{"format": {"duration": "600"}, "streams": []}\' ;;\n'
+        "esac\n"
+    )
+    os.chmod(fake, 0o755)
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    for name in ["a.mkv", "b.mkv", "bad.mkv"]:
+        (incoming / name).write_bytes(b"x")
+
+    def run(executor):
+        cfg = make_cfg(tmp_path, jobs=2)
+        ff = FFProbeConfig(bin=str(fake), args=[], jobs=2, executor=executor)
+        return inventory_mod.build_inventory(replace(cfg, ffprobe=ff), rescan=True)
+
+    threads, procs = run("thread"), run("process")
+
+    assert procs["errors"] == threads["errors"] == 1
+    assert procs["items"] == threads["items"]
+
+
+def test_lazy_items_stream_from_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(inventory_mod, "run_ffprobe", _fake_ffprobe)
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    for name in ["a.mkv", "b.mkv"]:
+        (incoming / name).write_bytes(b"x")
+    cfg = make_cfg(tmp_path, jobs=1)
+
+    full = inventory_mod.build_inventory(cfg, rescan=True)
+    lazy = inventory_mod.build_inventory(cfg, rescan=False, lazy_items=True)
+
+    assert not isinstance(lazy["items"], list)
+    assert lazy["count"] == 2
+    assert list(lazy["items"]) == full["items"]
+
+
+def test_lazy_items_after_rescan(tmp_path, monkeypatch):
+    monkeypatch.setattr(inventory_mod, "run_ffprobe", _fake_ffprobe)
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    for name in ["b.mkv", "a.mkv"]:
+        (incoming / name).write_bytes(b"x")
+    cfg = make_cfg(tmp_path, jobs=2)
+
+    # A rescan already holds the items; they aren't re-read from the cache.
+    fresh = inventory_mod.build_inventory(cfg, rescan=True, lazy_items=True)
+    assert isinstance(fresh["items"], list)
+    assert [it["relpath"] for it in fresh["items"]] == ["a.mkv", "b.mkv"]
+
+    # Loaded from the cache, items stream from the file.
+    lazy = inventory_mod.build_inventory(cfg, rescan=False, lazy_items=True)
+    assert not isinstance(lazy["items"], list)
+    assert lazy["count"] == 2
+    assert list(lazy["items"]) == fresh["items"] == cache_mod.read_cache(cfg)["items"]
+
+
+def test_rescan_returns_what_the_cache_holds(tmp_path, monkeypatch):
+    monkeypatch.setattr(inventory_mod, "run_ffprobe", _fake_ffprobe)
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    for name in ["b.mkv", "a.mkv", "bad.mkv"]:
+        (incoming / name).write_bytes(b"x")
+    cfg = make_cfg(tmp_path, jobs=2)
+
+    inv = inventory_mod.build_inventory(cfg, rescan=True)
+    assert inv == cache_mod.read_cache(cfg)
@@ -170,3 +170,79 @@ def test_transfer_uses_proposed_name(tmp_path):
         / "Renamed Movie (2020).mkv"
     )
     assert dst.exists()
+
+
+def test_render_name_derives_facts_once(monkeypatch):
+    import tomllib
+
+    import sift.router as router
+    from sift.config import parse_config
+
+    ex = Path(__file__).resolve().parents[1] / "config.example.toml"
+    cfg = parse_config(tomllib.loads(ex.read_text(encoding="utf-8")))
+    calls = []
+    real = router.derive_facts
+
+    def counting(cfg, item):
+        calls.append(item["relpath"])
+        return real(cfg, item)
+
+    monkeypatch.setattr(router, "derive_facts", counting)
+    item = {
+        "relpath": "Movie.2020.mkv",
+        "ffprobe": {
+            "ok": True,
+            "video": {"codec": "hevc", "width": 3840, "height": 2160},
+            "audio": {"codec": "eac3", "channels": 6},
+        },
+    }
+    assert router.render_name(cfg, item)
+    assert calls == ["Movie.2020.mkv"]
+
+    calls.clear()
+    router.route_destination(cfg, item)
+    assert calls == ["Movie.2020.mkv"]
+
+
+def test_template_tokens_expand_in_one_pass():
+    import tomllib
+    from dataclasses import replace
+
+    from sift.config import parse_config
+    from sift.router import render_name
+
+    ex = Path(__file__).resolve().parents[1] / "config.example.toml"
+    cfg = parse_config(tomllib.loads(ex.read_text(encoding="utf-8")))
+    naming = replace(cfg.naming, movie_template="{title} {year} {nope}.{ext}")
+    cfg = replace(cfg, naming=naming)
+    item = {"relpath": "A {ext} B.2020.mkv", "ffprobe": {"ok": True}}
+
+    # Token-like text inside values is not expanded again; unknown tokens stay.
+    assert render_name(cfg, item) == "A {ext} B 2020 {nope}.mkv"
+
+
+def test_codec_map_keys_are_case_insensitive():
+    import tomllib
+    from dataclasses import replace
+
+    from sift.config import parse_config
+    from sift.router import render_name
+
+    ex = Path(__file__).resolve().parents[1] / "config.example.toml"
+    cfg = parse_config(tomllib.loads(ex.read_text(encoding="utf-8")))
+    naming = replace(
+        cfg.naming,
+        movie_template="{title} {vcodec_tag}.{ext}",
+        vcodec_map={"HEVC": "x265", "H264": "AVC", "h264": "x264"},
+    )
+    cfg = replace(cfg, naming=naming)
+
+    def name(vcodec):
+        item = {
+            "relpath": "Movie.mkv",
+            "ffprobe": {"ok": True, "video": {"codec": vcodec}},
+        }
+        return render_name(cfg, item)
+
+    assert name("hevc") == "Movie x265.mkv"
+    assert name("h264") == "Movie x264.mkv"
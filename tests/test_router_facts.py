@@ -0,0 +1,181 @@
+import pickle
+import tomllib
+from pathlib import Path
+
+from sift.config import parse_config
+from sift.router import derive_facts, tier_for_item
+from sift.rules import compile_rule, match_value
+
+
+def _cfg():
+    ex = Path(__file__).resolve().parents[1] / "config.example.toml"
+    return parse_config(tomllib.loads(ex.read_text(encoding="utf-8")))
+
+
+def _item(video=None, audio=None):
+    ff = {"ok": True, "video": video or {}, "audio": audio or {}}
+    return {"relpath": "Movie.2020.mkv", "ffprobe": ff}
+
+
+def test_hdr_from_transfer_side_data_and_tags():
+    cfg = _cfg()
+    assert derive_facts(cfg, _item({"color_transfer": "smpte2084"}))["hdr"]
+    assert derive_facts(cfg, _item({"side_data_types": ["DOVI configuration record"]}))[
+        "hdr"
+    ]
+    assert derive_facts(cfg, _item({"tags": {"HDR_FORMAT": "HDR10+"}}))["hdr"]
+    assert not derive_facts(cfg, _item({"profile": "Main 10", "tags": {}}))["hdr"]
+    assert not derive_facts(cfg, {"relpath": "x.mkv", "ffprobe": {"ok": True}})["hdr"]
+
+
+def test_problem_audio_from_codec_or_profile():
+    cfg = _cfg()
+    assert derive_facts(cfg, _item(audio={"codec": "truehd"}))["problem_audio"]
+    assert derive_facts(cfg, _item(audio={"codec": "dts", "profile": "DTS-HD MA"}))[
+        "problem_audio"
+    ]
+    assert not derive_facts(cfg, _item(audio={"codec": "eac3"}))["problem_audio"]
+
+
+def test_pattern_lists_fold_into_one_scan_when_safe():
+    from dataclasses import replace
+
+    cls = _cfg().classification
+    assert len(cls.hdr_side_data_scan) == 1
+    assert len(cls.problem_audio_profile_scan) == 1
+
+    # A leading (?i) can't sit inside an alternation; keep the patterns apart.
+    cls = replace(cls, hdr_side_data_regex=["(?i)dovi", "hdr10"])
+    assert [p.pattern for p in cls.hdr_side_data_scan] == ["(?i)dovi", "hdr10"]
+    cfg = replace(_cfg(), classification=cls)
+    assert derive_facts(cfg, _item({"side_data_types": ["DOVI config"]}))["hdr"]
+
+
+def test_repeated_hints_reuse_memoized_matches():
+    from sift.router import _matches_any
+
+    cfg = _cfg()
+    item = _item({"profile": "Main 10"}, {"codec": "dts", "profile": "DTS-HD MA"})
+    facts = derive_facts(cfg, item)
+    hits = _matches_any.cache_info().hits
+    assert derive_facts(cfg, item) == facts
+    assert _matches_any.cache_info().hits >= hits + 2
+
+
+def test_compiled_rules_match_like_match_value():
+    rules = [
+        "HEVC",
+        ["2160p", "1080p", 1],
+        True,
+        6,
+        {"min": 2},
+        {"max": "6"},
+        {"min": 2, "max": 6},
+        {"regex": "^dts"},
+        {"regex": "(bad"},
+        {"regex": 3},
+        {"eq": "x"},
+        {"other": 1},
+    ]
+    actuals = [None, "hevc", "HEVC", "1080P", 1, True, 6, "6", 8, "dts-hd", [], 0]
+    for rule in rules:
+        pred = compile_rule(rule)
+        for actual in actuals:
+            assert pred(actual) == match_value(actual, rule), (rule, actual)
+
+
+def test_tier_requires_survive_pickling():
+    cfg = _cfg()
+    item = _item({"codec": "hevc", "width": 3840, "height": 2160})
+    tier = tier_for_item(cfg, item)
+
+    clone = pickle.loads(pickle.dumps(cfg))
+    assert tier_for_item(clone, item) == tier
+    assert clone.tier_model.tier[0].requires_compiled is not None
+
+
+def test_resolution_buckets_use_configured_thresholds():
+    from dataclasses import replace
+
+    cfg = _cfg()
+    cls = replace(cfg.classification, vertical_thresholds={"1080p": 800})
+    cfg = replace(cfg, classification=cls)
+
+    def res(w, h):
+        return derive_facts(cfg, _item({"width": w, "height": h}))["res"]
+
+    assert res(3840, 1600) == "2160p"
+    assert res(1920, 2100) == "2160p"
+    assert res(1440, 810) == "1080p"
+    assert res(1280, 720) == "720p"
+    assert res(640, 480) == "SD"
+    assert res(None, None) == "SD"
+
+
+def test_res_prefilter_keeps_first_match_order():
+    from dataclasses import replace
+
+    from sift.model import TierDef, TierModelConfig
+    from sift.rules import requires_match
+
+    def tier(i, requires):
+        return TierDef(
+            id=f"T{i}", folder=f"t{i}", description="", requires=requires, flags=[]
+        )
+
+    tiers = [
+        tier(1, {"res": ["2160P"], "hdr": True}),
+        tier(2, {"vcodec": ["hevc"]}),
+        tier(3, {"res": {"eq": "1080p"}}),
+        tier(4, {"res": {"regex": "^7"}}),
+        tier(5, {"res": []}),
+        tier(6, "not-a-table"),
+        tier(7, {"res": "sd"}),
+        tier(8, {}),
+    ]
+    cfg = _cfg()
+    cfg = replace(cfg, tier_model=TierModelConfig(tiers=5, tier=tiers))
+
+    for res in ["2160p", "1080p", "720p", "SD", "480p", None]:
+        for hdr in (True, False):
+            for vcodec in ("hevc", "h264"):
+                facts = {"res": res, "hdr": hdr, "vcodec": vcodec}
+                expected = next(
+                    t for t in tiers if requires_match(t.requires_compiled, facts)
+                )
+                assert tier_for_item(cfg, {}, facts) is expected, facts
+
+
+def test_tier_decisions_are_memoized_on_required_facts():
+    import gc
+
+    from sift.router import _TIER_DECISIONS, _tier_decisions
+
+    cfg = _cfg()
+    model = cfg.tier_model
+    assert "res" in model.requires_keys
+    decisions = _tier_decisions(model)
+
+    hevc = _item({"codec": "hevc", "width": 3840, "height": 2160, "profile": "a"})
+    tier = tier_for_item(cfg, hevc)
+    assert len(decisions) == 1
+
+    # A fact no tier reads doesn't split the cache entry...
+    facts = dict(derive_facts(cfg, hevc), unrelated="x")
+    assert tier_for_item(cfg, hevc, facts) is tier
+    assert len(decisions) == 1
+
+    # ...and a cached decision is what the full evaluation would pick.
+    sd = _item({"codec": "h264", "width": 640, "height": 480})
+    first = tier_for_item(cfg, sd)
+    assert tier_for_item(cfg, sd) is first
+    decisions.clear()
+    assert tier_for_item(cfg, sd) is first
+
+    # The memo lives beside the config, not in it, and goes away with it.
+    clone = pickle.loads(pickle.dumps(cfg))
+    assert _tier_decisions(clone.tier_model) == {}
+    model_id = id(model)
+    del cfg, model
+    gc.collect()
+    assert model_id not in _TIER_DECISIONS
@@ -211,3 +211,34 @@ def test_disabled_sample_detection(tmp_path):
     _mark_samples(cfg, items)
     # When disabled, no samples should be marked
     assert "skip_reason" not in items[0]
+
+
+def test_normalize_stem_separators_and_tags():
+    assert _normalize_stem("Show_Sample_4K") == "show"
+    assert _normalize_stem("Movie.(2019).Bonus-720p") == "movie"
+    assert _normalize_stem("Movie (a[b) c]") == "movie (a"
+    assert _normalize_stem("Samples.1080px") == "samples 1080px"
+
+
+def test_prefer_longest_variant_groups_only_shared_stems(tmp_path):
+    cfg = make_cfg(tmp_path, prefer_longest_variant=True, min_duration_s=60.0)
+
+    def item(rel, dur):
+        ff = {"ok": True, "stream_counts": {"video": 1, "audio": 1}}
+        if dur is not None:
+            ff["duration_s"] = dur
+        return {"relpath": rel, "path": str(tmp_path / rel), "ffprobe": ff}
+
+    items = [
+        item("Other.Film.mkv", 100.0),
+        item("Movie.720p.mkv", 3000.0),
+        item("Movie.mkv", None),
+        item("Movie.2160p.mkv", 3600.0),
+    ]
+    _mark_samples(cfg, items)
+    assert [it.get("skip_reason") for it in items] == [
+        None,
+        "sample_shorter_variant",
+        None,
+        None,
+    ]
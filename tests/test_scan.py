@@ -2,7 +2,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from sift.scan import scan_files
+from sift.scan import scan_entries, scan_files
 
 
 class TestScan(unittest.TestCase):
@@ -16,3 +16,38 @@ class TestScan(unittest.TestCase):
             paths = scan_files(root, only_ext=["mp4", ".mkv"])
             rel = [p.name for p in paths]
             self.assertEqual(rel, ["a.mp4", "b.mkv"])
+
+    def test_scan_recurses_sorts_by_relpath_and_limits(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "b" / "deep").mkdir(parents=True)
+            (root / "b" / "deep" / "x.MKV").write_bytes(b"x")
+            (root / "a.mkv").write_bytes(b"x")
+            (root / "c.mkv").write_bytes(b"x")
+            (root / ".mkv").write_bytes(b"x")
+
+            paths = scan_files(root, only_ext=["mkv"])
+            rel = [str(p.relative_to(root)) for p in paths]
+            self.assertEqual(rel, ["a.mkv", str(Path("b/deep/x.MKV")), "c.mkv"])
+
+            limited = scan_files(root, only_ext=["mkv"], limit=2)
+            self.assertEqual(limited, paths[:2])
+
+    def test_parallel_scan_matches_serial(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            for d in ("a", "a/x", "b", "b/y/z", "c"):
+                (root / d).mkdir(parents=True, exist_ok=True)
+                (root / d / "f.mkv").write_bytes(b"x")
+                (root / d / "g.txt").write_bytes(b"x")
+
+            serial = scan_files(root, only_ext=["mkv"])
+            self.assertEqual(len(serial), 5)
+            self.assertEqual(
+                scan_entries(root, only_ext=["mkv"], parallelism=4),
+                scan_entries(root, only_ext=["mkv"]),
+            )
+            self.assertEqual(
+                scan_entries(root, only_ext=["mkv"], limit=2, parallelism=4),
+                scan_entries(root, only_ext=["mkv"])[:2],
+            )
@@ -148,3 +148,207 @@ def test_real_copy_prints_and_writes_file(tmp_path, capsys):
 
     # cleanup
     shutil.rmtree(cfg.paths.outgoing_root)
+
+
+def test_copy_falls_back_when_kernel_copy_is_refused(tmp_path, monkeypatch, capsys):
+    import errno
+    import os
+
+    import sift.transfer as transfer_mod
+
+    calls = []
+
+    def partial_then_exdev(src_fd, dst_fd, count):
+        # Copy one small piece, then refuse like a cross-device copy would.
+        if calls:
+            raise OSError(errno.EXDEV, "cross-device")
+        calls.append(count)
+        return os.write(dst_fd, os.read(src_fd, 5))
+
+    monkeypatch.setattr(transfer_mod, "_KERNEL_COPIES", [partial_then_exdev])
+    src = tmp_path / "a.mkv"
+    src.write_bytes(bytes(range(256)) * 4096)
+    dst = tmp_path / "b.mkv"
+
+    transfer_mod._copy_with_progress(src, dst, chunk_size=64 * 1024)
+    assert dst.read_bytes() == src.read_bytes()
+    assert calls
+    assert "100%" in capsys.readouterr().out
+
+
+def test_pipelined_copy_matches_source(tmp_path, monkeypatch):
+    import sift.transfer as transfer_mod
+
+    monkeypatch.setattr(transfer_mod, "_KERNEL_COPIES", [])
+    monkeypatch.setattr(transfer_mod, "_PIPELINE_MIN_SIZE", 0)
+    src = tmp_path / "a.mkv"
+    src.write_bytes(bytes(range(251)) * 4001)
+    dst = tmp_path / "b.mkv"
+
+    with src.open("rb") as inf, dst.open("wb") as outf:
+        steps = list(transfer_mod._copy_steps(inf, outf, 64 * 1024, 1))
+    assert sum(steps) == src.stat().st_size
+    assert len(steps) > 2
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_parallel_copy_matches_sequential(tmp_path, capsys):
+    from dataclasses import replace
+
+    def run(base, workers):
+        cfg = make_cfg(base)
+        cfg = replace(cfg, io=replace(cfg.io, transfer_parallelism=workers))
+        cfg.paths.incoming.mkdir(parents=True)
+        items = []
+        # Several distinct files plus collisions on the same destination name
+        # (exact and via a dedup variant), which must resolve in item order.
+        names = ["a.mkv", "b.mkv", "a.mkv", "c (1).mkv", "c.mkv", "d.mkv"]
+        for i, name in enumerate(names):
+            src = cfg.paths.incoming / f"{i}.mkv"
+            src.write_bytes(str(i).encode() * 1000)
+            items.append(
+                {
+                    "relpath": f"{i}.mkv",
+                    "path": str(src),
+                    "proposed_name": name,
+                    "ffprobe": {"ok": True},
+                }
+            )
+        result = transfer_inventory(cfg, {"items": items}, dry_run=False)
+        details = [
+            (d["proposed_name"], d["action"], d.get("reason")) for d in result.details
+        ]
+        return result.copied, result.skipped, details
+
+    sequential = run(tmp_path / "seq", 1)
+    assert sequential[:2] == (4, 2)
+    assert run(tmp_path / "par", 4) == sequential
+
+
+def test_progress_reports_each_tenth_and_only_completion_for_small_files(
+    tmp_path, monkeypatch, capsys
+):
+    import sift.transfer as transfer_mod
+
+    monkeypatch.setattr(transfer_mod, "_KERNEL_COPIES", [])
+    src = tmp_path / "a.mkv"
+    src.write_bytes(b"x" * 100_000)
+
+    transfer_mod._copy_with_progress(src, tmp_path / "b.mkv", chunk_size=1000)
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1 and "100%" in lines[0]
+
+    monkeypatch.setattr(transfer_mod, "_PROGRESS_MIN_SIZE", 0)
+    transfer_mod._copy_with_progress(src, tmp_path / "c.mkv", chunk_size=1000)
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split("— ")[1].split("%")[0] for line in lines] == [
+        str(p) for p in range(10, 101, 10)
+    ]
+
+
+def test_missing_source_is_skipped(tmp_path):
+    cfg = make_cfg(tmp_path)
+    cfg.paths.incoming.mkdir(parents=True)
+    item = {
+        "relpath": "gone.mkv",
+        "path": str(cfg.paths.incoming / "gone.mkv"),
+        "ffprobe": {"ok": True},
+    }
+
+    result = transfer_inventory(cfg, {"items": [item]}, dry_run=False)
+    assert result.skipped == 1
+    assert result.details[0]["reason"] == "source_missing"
+
+
+def test_copy_keeps_mode_and_times_unless_disabled(tmp_path):
+    import os
+
+    import sift.transfer as transfer_mod
+
+    src = tmp_path / "a.mkv"
+    src.write_bytes(b"x" * 10)
+    os.chmod(src, 0o640)
+    os.utime(src, ns=(1_000_000_000, 2_000_000_000))
+
+    transfer_mod._copy_with_progress(src, tmp_path / "b.mkv")
+    st = (tmp_path / "b.mkv").stat()
+    assert st.st_mtime_ns == 2_000_000_000
+    assert st.st_mode & 0o777 == 0o640
+
+    transfer_mod._copy_with_progress(src, tmp_path / "c.mkv", preserve_metadata=False)
+    assert (tmp_path / "c.mkv").stat().st_mtime_ns != 2_000_000_000
+
+
+def test_kernel_copy_returning_zero_early_falls_back(tmp_path, monkeypatch):
+    import sift.transfer as transfer_mod
+
+    def nothing_copied(src_fd, dst_fd, count):
+        return 0
+
+    monkeypatch.setattr(transfer_mod, "_KERNEL_COPIES", [nothing_copied])
+    src = tmp_path / "a.mkv"
+    src.write_bytes(b"x" * 5000)
+
+    transfer_mod._copy_with_progress(src, tmp_path / "b.mkv")
+    assert (tmp_path / "b.mkv").read_bytes() == src.read_bytes()
+
+
+def test_short_cross_device_move_keeps_source(tmp_path, monkeypatch):
+    import errno
+    import os
+    from dataclasses import replace
+
+    import sift.transfer as transfer_mod
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    def half_copy(inf, outf, chunk_size, total=0):
+        data = inf.read(total // 2)
+        outf.write(data)
+        yield len(data)
+
+    monkeypatch.setattr(os, "rename", cross_device)
+    monkeypatch.setattr(transfer_mod, "_copy_steps", half_copy)
+    cfg = make_cfg(tmp_path)
+    cfg = replace(cfg, io=replace(cfg.io, mode="move"))
+    cfg.paths.incoming.mkdir(parents=True)
+    src = cfg.paths.incoming / "movie.mkv"
+    src.write_bytes(b"x" * 1000)
+    item = {"relpath": "movie.mkv", "path": str(src), "ffprobe": {"ok": True}}
+
+    result = transfer_inventory(cfg, {"items": [item]}, dry_run=False)
+    assert result.failed == 1 and result.moved == 0
+    assert "copied 500 of 1000 bytes" in result.details[0]["reason"]
+    assert src.read_bytes() == b"x" * 1000
+    assert not Path(result.details[0]["dst"]).exists()
+
+
+def test_parallel_copy_waits_for_every_copy_answering_for_a_name(tmp_path, monkeypatch):
+    import time
+    from dataclasses import replace
+
+    import sift.transfer as transfer_mod
+
+    real_copy = transfer_mod._copy_with_progress
+
+    def slow_first(src, dst, **kw):
+        if src.name == "0.mkv":
+            time.sleep(0.2)
+        real_copy(src, dst, **kw)
+
+    monkeypatch.setattr(transfer_mod, "_copy_with_progress", slow_first)
+    cfg = make_cfg(tmp_path)
+    cfg = replace(cfg, io=replace(cfg.io, transfer_parallelism=4))
+    cfg.paths.incoming.mkdir(parents=True)
+    items = []
+    # Both variants answer for "c.mkv"; the slow one finishes last.
+    for i, name in enumerate(["c (1).mkv", "c (2).mkv", "c.mkv"]):
+        src = cfg.paths.incoming / f"{i}.mkv"
+        src.write_bytes(b"x")
+        items.append({"relpath": f"{i}.mkv", "path": str(src), "proposed_name": name})
+
+    result = transfer_inventory(cfg, {"items": items}, dry_run=False)
+    assert result.copied == 2
+    assert result.details[2]["reason"] == "already_processed"
+    assert result.details[2]["existing_path"].endswith("c (1).mkv")
@@ -147,3 +147,30 @@ def test_transfer_skips_if_dedup_variant_exists(tmp_path, capsys):
 
     # cleanup
     shutil.rmtree(cfg.paths.outgoing_root)
+
+
+def test_transfer_skips_duplicates_written_earlier_in_the_run(tmp_path, capsys):
+    cfg = make_cfg(tmp_path)
+    src_dir = cfg.paths.incoming
+    (src_dir / "a").mkdir(parents=True)
+    (src_dir / "b").mkdir(parents=True)
+    items = []
+    for sub in ("a", "b"):
+        src_file = src_dir / sub / "movie.mkv"
+        src_file.write_bytes(b"0" * 1024)
+        items.append(
+            {
+                "relpath": f"{sub}/movie.mkv",
+                "path": str(src_file),
+                "proposed_name": "movie.mkv",
+                "ffprobe": {"ok": True},
+            }
+        )
+
+    result = transfer_inventory(cfg, {"items": items}, dry_run=False)
+    assert result.copied == 1
+    assert result.skipped == 1
+    assert result.details[1]["reason"] == "already_processed"
+    assert result.details[1]["existing_path"] == result.details[0]["dst"]
+
+    shutil.rmtree(cfg.paths.outgoing_root)